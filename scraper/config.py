@@ -1,16 +1,20 @@
 """Configuration settings for the scraper."""
+import functools
 import os
 from pathlib import Path
 from dotenv import load_dotenv
+from urllib3.util.request import ACCEPT_ENCODING
 
 # Load environment variables from .env file
 # Tries scraper/.env first, then falls back to root .env
 # All scraper vars use SCRAPER_ prefix to avoid conflicts with n8n (N8N_ prefix)
+# Paths are resolved explicitly so load_dotenv never has to walk the directory tree
 env_path = Path(__file__).parent / ".env"
+root_env_path = Path(__file__).parent.parent / ".env"
 if env_path.exists():
     load_dotenv(env_path)
-else:
-    load_dotenv()  # Fall back to root .env
+elif root_env_path.exists():
+    load_dotenv(root_env_path)  # Fall back to root .env
 
 # Base paths
 BASE_DIR = Path(__file__).parent
@@ -20,10 +24,13 @@ DOWNLOADS_DIR = SCRAPER_DIR / "downloads"
 LOGS_DIR = SCRAPER_DIR / "logs"
 SEEDS_FILE = SCRAPER_DIR / "seeds.txt"
 
-# Ensure directories exist
-DATA_DIR.mkdir(exist_ok=True)
-DOWNLOADS_DIR.mkdir(exist_ok=True)
-LOGS_DIR.mkdir(exist_ok=True)
+
+@functools.cache
+def ensure_dir(path: Path) -> Path:
+    """Create an output directory on first use (cached, so mkdir runs once per path)."""
+    path.mkdir(exist_ok=True)
+    return path
+
 
 # Scraper settings
 USER_AGENT = os.getenv("SCRAPER_USER_AGENT", "UniversityEmailScraper/1.0 (Contact: your-email@example.com)")
@@ -32,10 +39,27 @@ MAX_PAGES_PER_DOMAIN = int(os.getenv("SCRAPER_MAX_PAGES", "2000"))  # Increased
 TIMEOUT_SECONDS = int(os.getenv("SCRAPER_TIMEOUT", "30"))  # Increased for slow .dz sites
 CONNECT_TIMEOUT_SECONDS = float(os.getenv("SCRAPER_CONNECT_TIMEOUT", "10"))  # Reduced for faster failure on unreachable sites
 READ_TIMEOUT_SECONDS = float(os.getenv("SCRAPER_READ_TIMEOUT", str(TIMEOUT_SECONDS)))
+MAX_PAGE_BYTES = int(os.getenv("SCRAPER_MAX_PAGE_BYTES", str(2 * 1024 * 1024)))  # Stop reading a page after 2 MB
 ROBOTS_TIMEOUT_SECONDS = float(os.getenv("SCRAPER_ROBOTS_TIMEOUT", "3"))  # Reduced for faster failure
+ROBOTS_CACHE_TTL_SECONDS = float(os.getenv("SCRAPER_ROBOTS_CACHE_TTL", str(6 * 3600)))  # Re-fetch robots.txt after 6 hours
+ROBOTS_NEGATIVE_TTL_SECONDS = float(os.getenv("SCRAPER_ROBOTS_NEGATIVE_TTL", "600"))  # Retry failed robots.txt after 10 minutes
+ROBOTS_CACHE_SIZE = int(os.getenv("SCRAPER_ROBOTS_CACHE_SIZE", "1024"))  # Max hosts kept in the robots.txt cache
+ROBOTS_PREFETCH_WORKERS = 32  # Parallel robots.txt fetches when warming the cache for all seeds
+ROBOTS_MAX_BYTES = 500 * 1024  # Only parse the first 500 KB of robots.txt (same limit as Google)
+DNS_CACHE_TTL_SECONDS = 300  # Reuse resolved addresses for 5 minutes
+DNS_NEGATIVE_TTL_SECONDS = 120  # Remember hosts that do not resolve (mostly probed subdomains)
+DNS_CACHE_SIZE = 1024  # Most recently used hostnames kept in the DNS cache
 RETRY_ATTEMPTS = int(os.getenv("SCRAPER_RETRIES", "3"))
 RETRY_BACKOFF_BASE = float(os.getenv("SCRAPER_BACKOFF", "1.0"))
 MAX_WORKERS = int(os.getenv("SCRAPER_MAX_WORKERS", "10"))  # Concurrent requests (increased for faster scraping)
+DOMAIN_WORKERS = int(os.getenv("SCRAPER_DOMAIN_WORKERS", "4"))  # Seed domains crawled at the same time (each with MAX_WORKERS threads)
+HTTP_POOL_HOSTS = 64  # Hosts (seed, www variant, department subdomains) whose keep-alive connections stay open
+# Headless browsers kept open for JS-rendered pages, one per domain crawled at once by
+# default. Each Chromium takes a few hundred MB; with fewer browsers than crawl threads,
+# renders queue up for a free browser (bounded by PLAYWRIGHT_TIMEOUT_SECONDS)
+PLAYWRIGHT_WORKERS = int(os.getenv("SCRAPER_PLAYWRIGHT_WORKERS", str(DOMAIN_WORKERS)))
+# Longest a page waits for a free browser plus its render before it is given up on
+PLAYWRIGHT_TIMEOUT_SECONDS = float(os.getenv("SCRAPER_PLAYWRIGHT_TIMEOUT", str(TIMEOUT_SECONDS * 3)))
 
 # User-Agent rotation for better stealth
 USER_AGENTS = [
@@ -48,9 +72,36 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
 ]
 
+UA_ROTATE_EVERY = 16  # Switch to the next User-Agent after this many requests (and on retries)
+
+# Browser headers sent with every page request
+BROWSER_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    # Only encodings urllib3 can decode here: 'br' needs the brotli package (a br
+    # response would otherwise come back as undecoded bytes)
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0',
+    'Referer': 'https://www.google.com/',  # Fake referer
+}
+
 # Output files
-OUTPUT_RAW = DATA_DIR / "emails_raw.csv"
+# The raw file grows with every run - optionally keep it gzip-compressed
+COMPRESS_RAW_OUTPUT = os.getenv("SCRAPER_GZIP_RAW", "false").lower() in ("1", "true", "yes")
+OUTPUT_RAW = DATA_DIR / ("emails_raw.csv.gz" if COMPRESS_RAW_OUTPUT else "emails_raw.csv")
 OUTPUT_CLEAN = DATA_DIR / "emails_clean.csv"
+RAW_WRITE_BATCH_SIZE = 1000  # Raw email rows written to OUTPUT_RAW per append
+
+# On-disk HTTP cache (off by default): re-runs send conditional GETs and reuse
+# unchanged pages, and robots.txt is reused until ROBOTS_CACHE_TTL_SECONDS
+USE_DISK_CACHE = os.getenv("SCRAPER_DISK_CACHE", "false").lower() in ("1", "true", "yes")
+DISK_CACHE_FILE = DATA_DIR / "http_cache.sqlite3"
 
 # Email filtering
 ALLOWED_EMAIL_DOMAIN = ".dz"  # Only .dz emails
@@ -88,6 +139,9 @@ EXCLUDED_EMAIL_PATTERNS = [
     # University-wide emails
     'univ-mcd', 'univ.',
 ]
+# Freeze the patterns (dropping exact duplicates) and order them longest-first
+# so alternation-based matchers try the most specific token first
+EXCLUDED_EMAIL_PATTERNS = tuple(sorted(dict.fromkeys(EXCLUDED_EMAIL_PATTERNS), key=len, reverse=True))
 
 # Logging
 LOG_LEVEL = os.getenv("SCRAPER_LOG_LEVEL", "INFO")
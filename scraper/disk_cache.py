@@ -0,0 +1,68 @@
+"""On-disk HTTP cache so re-runs only re-download pages that changed."""
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from threading import Lock
+from typing import NamedTuple, Optional
+
+
+class CachedResponse(NamedTuple):
+    """A stored response body with the validators needed to revalidate it."""
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    encoding: Optional[str]
+    body: bytes
+    fetched_at: float
+
+
+class DiskCache:
+    """SQLite-backed store of response bodies keyed by URL (stdlib only, thread-safe)."""
+    
+    def __init__(self, path: Path):
+        self._lock = Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        # WAL + NORMAL sync: a write per page costs an append, not an fsync
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, encoding TEXT,"
+            " body BLOB NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+    
+    def get(self, url: str, max_age: Optional[float] = None) -> Optional[CachedResponse]:
+        """Return the stored response for url, or None if missing (or older than max_age seconds)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, etag, last_modified, encoding, body, fetched_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        # Check the age first - an expired entry is never decompressed
+        if max_age is not None and time.time() - row[5] > max_age:
+            return None
+        return CachedResponse(*row[:4], zlib.decompress(row[4]), row[5])
+    
+    def put(self, url: str, body: bytes, etag: Optional[str] = None,
+            last_modified: Optional[str] = None, encoding: Optional[str] = None):
+        """Store (or replace) the response body for url."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, encoding, zlib.compress(body, 1), time.time()),
+            )
+            self._conn.commit()
+    
+    def touch(self, url: str):
+        """Mark a stored response as just revalidated (server answered 304)."""
+        with self._lock:
+            self._conn.execute("UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
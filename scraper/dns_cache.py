@@ -0,0 +1,76 @@
+"""In-process DNS cache in front of socket.getaddrinfo.
+
+requests/urllib3 resolve the hostname again for every new connection. A crawl
+opens many connections to the same few hosts, and probes department subdomains
+that mostly don't exist, so both answers and failures are cached for a while.
+"""
+import socket
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Tuple
+
+_original_getaddrinfo = socket.getaddrinfo
+
+# Only "this name does not exist" is worth remembering - temporary failures
+# (EAI_AGAIN, EAI_FAIL, ...) must not keep a real host unreachable
+NEGATIVE_CACHE_ERRORS = frozenset(
+    code for code in (getattr(socket, 'EAI_NONAME', None), getattr(socket, 'EAI_NODATA', None))
+    if code is not None
+)
+
+
+class DnsCache:
+    """LRU cache of getaddrinfo results and resolution failures, with TTLs (thread-safe)."""
+    
+    def __init__(self, ttl: float, negative_ttl: float, max_size: int = 1024):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_size = max_size
+        self._lock = Lock()
+        # getaddrinfo arguments -> (expires_at, addresses or gaierror args), least recently used first
+        self._entries: "OrderedDict[tuple, Tuple[float, bool, object]]" = OrderedDict()
+    
+    def getaddrinfo(self, *args, **kwargs):
+        """Drop-in replacement for socket.getaddrinfo."""
+        key = args + tuple(sorted(kwargs.items()))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                else:
+                    del self._entries[key]
+                    entry = None
+        if entry is not None:
+            _, ok, value = entry
+            if ok:
+                return value
+            # Raise a fresh error - re-raising a stored one would keep growing its traceback
+            raise socket.gaierror(*value)
+        
+        try:
+            addresses = _original_getaddrinfo(*args, **kwargs)
+        except socket.gaierror as e:
+            if e.errno in NEGATIVE_CACHE_ERRORS:
+                self._store(key, (now + self.negative_ttl, False, e.args))
+            raise
+        self._store(key, (now + self.ttl, True, addresses))
+        return addresses
+    
+    def _store(self, key: tuple, entry: Tuple[float, bool, object]):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def install(self):
+        """Route every socket.getaddrinfo call in this process through the cache."""
+        socket.getaddrinfo = self.getaddrinfo
+    
+    def uninstall(self):
+        """Put the original socket.getaddrinfo back (if this cache is still the one installed)."""
+        if socket.getaddrinfo == self.getaddrinfo:
+            socket.getaddrinfo = _original_getaddrinfo
@@ -0,0 +1,42 @@
+"""Matchers shared by the scraper and the cleaning script to filter emails."""
+import re
+
+# Aho-Corasick automaton (pyahocorasick) is optional - fall back to a single
+# compiled alternation regex when it is not installed
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def build_automaton(patterns):
+    """Build an Aho-Corasick automaton matching any of the given patterns."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern, pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+def build_substring_matcher(patterns):
+    """Build a function telling whether a string contains any of the patterns.
+    
+    One scan of the string regardless of how many patterns there are, instead of
+    one `pattern in s` test per pattern.
+    """
+    automaton = build_automaton(patterns)
+    if automaton is not None:
+        def matches(text: str) -> bool:
+            # First match is enough - stop the scan right away
+            for _ in automaton.iter(text):
+                return True
+            return False
+    else:
+        search = re.compile('|'.join(re.escape(p) for p in patterns)).search
+        
+        def matches(text: str) -> bool:
+            return search(text) is not None
+    
+    return matches
@@ -1,34 +1,50 @@
 """Script to clean existing emails CSV and remove non-person emails."""
+import contextlib
 import csv
+import itertools
+import os
 import sys
 from pathlib import Path
 
 # Add parent directory to path for config import
 scraper_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(scraper_dir))
-from config import EXCLUDED_EMAIL_PATTERNS, OUTPUT_CLEAN
+from config import EXCLUDED_EMAIL_PATTERNS, LOGS_DIR, OUTPUT_CLEAN, ensure_dir
+from email_filters import build_substring_matcher
 
 
-def is_institutional_email(email: str) -> bool:
-    """Check if email is an institutional/support email (not a real person)."""
-    if '@' not in email:
-        return False
+def _build_predicate(patterns, min_len: int = 3):
+    """Build the local-part predicate used by is_institutional_email."""
+    contains_pattern = build_substring_matcher(patterns)
     
-    try:
-        local_part = email.split('@')[0].lower()
-    except (ValueError, IndexError):
-        return False
-    
-    # Check against excluded patterns
-    for pattern in EXCLUDED_EMAIL_PATTERNS:
-        if pattern in local_part:
+    def predicate(local_part: str) -> bool:
+        if contains_pattern(local_part):
             return True
+        # Emails that are too short are likely generic
+        return len(local_part) < min_len
     
-    # Exclude emails that are too short (likely generic)
-    if len(local_part) < 3:
-        return True
-    
-    return False
+    return predicate
+
+
+# Built once at import time so every lookup is a single scan of the local part
+_is_excluded_local_part = _build_predicate(EXCLUDED_EMAIL_PATTERNS)
+
+# Input is read through a large buffer; kept rows are flushed to disk in
+# batches through a large write buffer
+READ_BUFFER_SIZE = 1 << 20  # 1 MiB
+WRITE_BATCH_SIZE = 1024
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+# Removed emails are listed here (written as they are found) instead of printed one by one
+REMOVED_LOG = LOGS_DIR / "removed_emails.log"
+
+
+def is_institutional_email(email: str) -> bool:
+    """Check if email is an institutional/support email (not a real person)."""
+    local_part, sep, _ = email.partition('@')
+    if not sep:
+        return False
+    return _is_excluded_local_part(local_part.lower())
 
 
 def clean_csv():
@@ -37,38 +53,74 @@ def clean_csv():
         print(f"File not found: {OUTPUT_CLEAN}")
         return
     
-    # Read all emails
-    emails = []
+    # Stream kept rows straight into a temp file, then swap it in atomically
+    tmp_path = OUTPUT_CLEAN.with_suffix('.tmp')
+    batch = []
     removed_count = 0
+    removed_log = None
+    kept_count = 0
+    writer = None
     
-    with open(OUTPUT_CLEAN, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
+    with open(OUTPUT_CLEAN, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f_in, \
+            contextlib.ExitStack() as stack:
+        # Hint the kernel to read ahead aggressively (POSIX only)
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f_in.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        # Plain lists are much cheaper than per-row dicts - resolve the email column once
+        reader = csv.reader(f_in)
+        header = next(reader, None)
+        if not header or 'email' not in header:
+            print(f"No 'email' column found in {OUTPUT_CLEAN}")
+            return
+        email_idx = header.index('email')
         
         for row in reader:
-            email = row.get('email', '').lower().strip()
+            email = row[email_idx].strip().lower() if len(row) > email_idx else ''
             
             if not email or '@' not in email:
-                continue
-            
-            # Check if it's an institutional email
-            if is_institutional_email(email):
+                pass  # Blank or invalid row - dropped
+            elif is_institutional_email(email):
+                if removed_log is None:
+                    ensure_dir(LOGS_DIR)
+                    removed_log = stack.enter_context(open(REMOVED_LOG, 'w', encoding='utf-8'))
+                removed_log.write(email + '\n')
                 removed_count += 1
-                print(f"Removing institutional email: {email}")
+            else:
+                kept_count += 1
+                if writer is not None:
+                    batch.append(row)
+                    if len(batch) >= WRITE_BATCH_SIZE:
+                        writer.writerows(batch)
+                        batch.clear()
                 continue
             
-            emails.append(row)
+            if writer is None:
+                # First dropped row - only now start the rewrite. Every row kept so far
+                # is an untouched prefix of the input, so replay it from the file
+                f_out = stack.enter_context(
+                    open(tmp_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+                )
+                writer = csv.writer(f_out)
+                writer.writerow(header)
+                with open(OUTPUT_CLEAN, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f_prefix:
+                    writer.writerows(itertools.islice(csv.reader(f_prefix), 1, kept_count + 1))
+        
+        if batch:
+            writer.writerows(batch)
+    
+    if writer is None:
+        print(f"\nNothing to clean - {kept_count} person emails in {OUTPUT_CLEAN} left unchanged")
+        return
     
-    # Write cleaned emails back
-    with open(OUTPUT_CLEAN, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(emails)
+    os.replace(tmp_path, OUTPUT_CLEAN)
     
     print(f"\nCleaned CSV:")
     print(f"  Removed: {removed_count} institutional emails")
-    print(f"  Remaining: {len(emails)} person emails")
+    print(f"  Remaining: {kept_count} person emails")
     print(f"  Saved to: {OUTPUT_CLEAN}")
+    if removed_count:
+        print(f"  Removed emails listed in: {REMOVED_LOG}")
 
 
 if __name__ == "__main__":
@@ -1,24 +1,30 @@
 """Main scraper script to extract .dz emails from university websites."""
+import atexit
 import csv
+import gzip
+import functools
+import itertools
 import re
 import time
+import zlib
 import logging
 import urllib.robotparser
 import random
-from collections import deque
+from collections import OrderedDict, deque
 from pathlib import Path
 from datetime import datetime
-from typing import List, Set, Dict, Optional, Tuple
+from typing import List, Set, Dict, Iterable, Iterator, Optional, Tuple
 from urllib.parse import urljoin, urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from queue import Queue
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from threading import Lock, Thread, local
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import urllib3
 from urllib3.exceptions import NameResolutionError as Urllib3NameResolutionError
-from bs4 import BeautifulSoup
-from tqdm import tqdm
+from lxml import etree
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 
 # Disable SSL warnings for sites with certificate issues
@@ -29,9 +35,13 @@ import sys
 scraper_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(scraper_dir))
 from config import *
+from disk_cache import DiskCache
+from dns_cache import DnsCache
+from email_filters import build_substring_matcher
 
 
 # Setup logging
+ensure_dir(LOG_FILE.parent)
 logging.basicConfig(
     level=getattr(logging, LOG_LEVEL),
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -42,14 +52,456 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# URL helpers are pure and see the same few thousand URLs over and over (every
+# page links to the same menus), so their results are memoized per URL string
+URL_CACHE_SIZE = 131072
+
+# Columns of OUTPUT_RAW
+RAW_FIELDNAMES = ['email', 'local_part', 'domain', 'source_url', 'source_type',
+                  'page_title', 'context_snippet', 'http_status', 'found_at',
+                  'parse_method', 'notes']
+# Leading characters a spreadsheet would evaluate as a formula (CSV injection)
+CSV_INJECTION_PREFIXES = ('=', '+', '-', '@')
+# Free-text columns that can start with one of those characters
+CSV_SANITIZED_FIELDS = ('page_title', 'context_snippet', 'notes')
+
+# Local parts starting with these belong to officials/services, not teachers
+ADMIN_LOCAL_PART_PREFIXES = ('vr.', 'doyen.', 'chef.', 'directeur.', 'director.', 'admin.', 'service.')
+# Cached is_institutional_email decisions (cleared when full)
+INSTITUTIONAL_CACHE_SIZE = 65536
+# Keywords that suggest pages with staff/contact information
+LINK_PRIORITY_KEYWORDS = ['staff', 'websites', 'contact', 'personnel', 'enseignants',
+                          'professeurs', 'equipe', 'team', 'annuaire', 'directory',
+                          'faculte', 'faculty', 'departement', 'department', 'corps',
+                          'enseignant', 'professeur', 'chercheur', 'researcher']
+# Enhanced keywords for finding teacher emails
+LINK_TEACHER_KEYWORDS = LINK_PRIORITY_KEYWORDS + [
+    'enseignant', 'enseignants', 'professeur', 'professeurs',
+    'teacher', 'teachers', 'faculty', 'staff', 'personnel',
+    'annuaire', 'directory', 'contact', 'equipe', 'team'
+]
+# Keywords for faculties/majors/departments (critical for finding teacher emails)
+LINK_FACULTY_KEYWORDS = [
+    'faculte', 'faculty', 'facultes', 'faculties',
+    'departement', 'department', 'departements', 'departments',
+    'filiere', 'specialite', 'speciality',
+    'formation', 'domaine', 'domain',
+    'section', 'option',
+    'mathematiques', 'mathematics', 'math', 'fmath',
+    'informatique', 'computer', 'info', 'cs',
+    'physique', 'physics', 'phys',
+    'chimie', 'chemistry', 'chim',
+    'biologie', 'biology', 'bio',
+    'electronique', 'electronics', 'elec',
+    'mecanique', 'mechanical', 'meca',
+    'genie', 'engineering', 'civil', 'archi',
+    'economie', 'economics', 'eco',
+    'droit', 'law', 'juridique',
+    'lettres', 'literature', 'langues',
+    'philosophie', 'philosophy', 'philo',
+    'sociologie', 'sociology', 'socio',
+    'psychologie', 'psychology', 'psy',
+    'medecine', 'medicine', 'med',
+    'pharmacie', 'pharmacy', 'pharma',
+    'sciences', 'sci',
+    'islamiques', 'islamic', 'fsi'
+]
+# Narrower lists used when ordering the crawl frontier
+FRONTIER_PRIORITY_KEYWORDS = ['staff', 'websites', 'contact', 'personnel', 'enseignants',
+                              'professeurs', 'annuaire', 'directory']
+FRONTIER_FACULTY_KEYWORDS = [
+    'faculte', 'faculty', 'facultes', 'faculties',
+    'departement', 'department', 'departements', 'departments',
+    'filiere', 'specialite', 'formation', 'domaine',
+    'section', 'option', 'mathematiques', 'informatique',
+    'physique', 'chimie', 'biologie', 'electronique',
+    'mecanique', 'genie', 'economie', 'droit',
+    'lettres', 'philosophie', 'sociologie', 'psychologie',
+    'medecine', 'pharmacie', 'sciences', 'islamiques', 'fsi'
+]
+# Link texts of next/previous/last pagination links (lowercase)
+PAGINATION_LINK_TEXTS = frozenset(['next', 'suivant', '»', 'last', 'dernier', 'precedent', 'previous', '«'])
+# One scan per link for each keyword list instead of one `in` test per keyword
+matches_link_priority_keyword = build_substring_matcher(LINK_PRIORITY_KEYWORDS)
+matches_link_teacher_keyword = build_substring_matcher(LINK_TEACHER_KEYWORDS)
+matches_link_faculty_keyword = build_substring_matcher(LINK_FACULTY_KEYWORDS)
+matches_frontier_priority_keyword = build_substring_matcher(FRONTIER_PRIORITY_KEYWORDS)
+matches_frontier_faculty_keyword = build_substring_matcher(FRONTIER_FACULTY_KEYWORDS)
+
+
+def _strip_www(netloc: str) -> str:
+    """Remove leading 'www.' from a hostname."""
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+@functools.lru_cache(maxsize=URL_CACHE_SIZE)
+def _get_base_domain(netloc: str) -> str:
+    """Extract base domain (e.g., 'univ-batna2.dz' from 'staff.univ-batna2.dz')."""
+    if not netloc:
+        return ''
+    parts = netloc.split('.')
+    # For .dz domains, take last 2 parts (e.g., 'univ-batna2.dz')
+    # Handles: staff.univ-batna2.dz -> univ-batna2.dz
+    # Handles: mail.univ-tlemcen.dz -> univ-tlemcen.dz
+    if len(parts) >= 2 and parts[-1] == 'dz':
+        return '.'.join(parts[-2:])
+    return netloc
+
+
+@functools.lru_cache(maxsize=URL_CACHE_SIZE)
+def _parse_url(url: str):
+    """urlparse, memoized - the result is an immutable named tuple, safe to share."""
+    return urlparse(url)
+
+
+@functools.lru_cache(maxsize=URL_CACHE_SIZE)
+def _host_root(url: str) -> str:
+    """'scheme://netloc/' of a URL, or the URL itself if it has no netloc."""
+    parsed = _parse_url(url)
+    return f"{parsed.scheme}://{parsed.netloc}/" if parsed.netloc else url
+
+
+@functools.lru_cache(maxsize=URL_CACHE_SIZE)
+def _urljoin(base_url: str, href: str) -> str:
+    return urljoin(base_url, href)
+
+
+def join_url(base_url: str, href: str) -> str:
+    """urljoin(base_url, href), memoized across the pages of a host.
+    
+    Root-relative ('/x') and absolute http(s) hrefs resolve the same against every
+    page of a host, so they are resolved against the host root instead: menus linked
+    from every page are joined once per host rather than once per page.
+    """
+    if ((href[:1] == '/' and href[1:2] != '/') or
+            (href.startswith(('http://', 'https://')) and _parse_url(href).netloc)):
+        return _urljoin(_host_root(base_url), href)
+    return _urljoin(base_url, href)
+
+
+@functools.lru_cache(maxsize=URL_CACHE_SIZE)
+def _scheme_and_base_domain(url: str) -> Optional[Tuple[str, str]]:
+    """Return (scheme, base domain) of a URL, or None if it cannot be parsed."""
+    try:
+        parsed = urlparse(url)
+    except Exception:
+        return None
+    return parsed.scheme, _get_base_domain(parsed.netloc)
+
+
+@functools.lru_cache(maxsize=URL_CACHE_SIZE)
+def normalize_url(url: str) -> str:
+    """Normalize URL to prevent duplicates (remove trailing slash, default scheme)."""
+    try:
+        parsed = urlparse(url)
+        # Skip if no netloc (invalid URL)
+        if not parsed.netloc:
+            return url
+        # Default to https if no scheme
+        scheme = parsed.scheme or 'https'
+        # Remove trailing slash from path (except root)
+        path = parsed.path.rstrip('/') or '/'
+        # Reconstruct URL
+        normalized = f"{scheme}://{parsed.netloc}{path}"
+        if parsed.query:
+            normalized += f"?{parsed.query}"
+        if parsed.fragment:
+            normalized += f"#{parsed.fragment}"
+        return normalized
+    except Exception:
+        return url
+
+
+def _base_domains_match(split1: Optional[Tuple[str, str]], split2: Optional[Tuple[str, str]]) -> bool:
+    """is_same_base_domain on already split URLs (see _scheme_and_base_domain).
+    
+    Lets a loop checking many links against one URL split that URL only once.
+    """
+    if split1 is None or split2 is None:
+        return False
+    scheme1, base1 = split1
+    scheme2, base2 = split2
+    
+    # Both must have valid base domains
+    if not base1 or not base2 or base1 != base2:
+        return False
+    
+    # Allow http/https to be considered the same
+    return (scheme1 == scheme2 or 
+            (scheme1 in ('http', 'https', '') and 
+             scheme2 in ('http', 'https', '')))
+
+
+def is_same_base_domain(url1: str, url2: str) -> bool:
+    """Check if two URLs belong to the same base domain (including subdomains)."""
+    return _base_domains_match(_scheme_and_base_domain(url1), _scheme_and_base_domain(url2))
+
+
+def truncate_incomplete_gzip_member(path: Path) -> bool:
+    """Cut a gzip file back to the end of its last complete member.
+    
+    A process killed while writing a member leaves it without its trailer, and
+    gzip readers then fail on the whole file. Returns True if a tail was cut off.
+    """
+    good_end = 0  # Offset just past the last complete member
+    offset = 0  # Offset of the first byte not yet fed to the decompressor
+    decompressor = zlib.decompressobj(wbits=31)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            try:
+                while chunk:
+                    # Output is discarded - only the member boundaries matter
+                    decompressor.decompress(chunk, 1 << 16)
+                    if decompressor.eof:
+                        offset += len(chunk) - len(decompressor.unused_data)
+                        good_end = offset
+                        chunk = decompressor.unused_data
+                        decompressor = zlib.decompressobj(wbits=31)
+                    elif decompressor.unconsumed_tail:
+                        offset += len(chunk) - len(decompressor.unconsumed_tail)
+                        chunk = decompressor.unconsumed_tail
+                    else:
+                        offset += len(chunk)
+                        chunk = b''
+            except zlib.error:
+                break
+        size = f.seek(0, 2)
+    if good_end == size:
+        return False
+    with open(path, 'r+b') as f:
+        f.truncate(good_end)
+    return True
+
+
+class PageContent:
+    """Everything the scraper reads from an HTML page, collected in one lxml parse.
+    
+    Used as an lxml parser target: lxml's C parser tokenizes the page and only the
+    events are handled here, without building a tree. Strings are split and
+    whitespace-collapsed the same way BeautifulSoup builds its tree from lxml's
+    events, so text and link text match what soup.get_text()/find_all() returned.
+    """
+    
+    # Strings inside these tags are not page text (script code, CSS, templates, ruby notes)
+    NON_TEXT_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+    # Whitespace-only strings inside these tags are kept as-is
+    PRESERVE_WHITESPACE_TAGS = frozenset(['pre', 'textarea'])
+    ASCII_SPACES = ' \t\n\r\x0c'
+    
+    def __init__(self):
+        self.title: Optional[str] = None  # String of the first <title> tag
+        self.strings: List[str] = []  # Page text strings, in document order
+        self.links: List[Tuple[str, List[str]]] = []  # (href, stripped text parts) of <a href>
+        self.data_emails: List[Tuple[str, List[str]]] = []  # (data-email, stripped text parts)
+        self.meta_contents: List[str] = []  # content of <meta content=...>
+        self.scripts: List[Optional[str]] = []  # Text of each <script> (None if empty)
+        
+        self._data: List[str] = []
+        self._stack: List[Tuple[str, Optional[List[str]]]] = []  # Open tags and their text collectors
+        self._collectors: List[List[str]] = []  # Text collectors of open <a href>/data-email tags
+        self._non_text_depth = 0
+        self._preserve_depth = 0
+        self._title_seen = False
+        self._current_text: Optional[str] = None  # String of the open <title>/<script>
+    
+    @classmethod
+    def parse(cls, html: str) -> 'PageContent':
+        """Parse HTML and return the collected page content."""
+        page = cls()
+        parser = etree.HTMLParser(target=page)
+        try:
+            parser.feed(html)
+            parser.close()
+        except (etree.LxmlError, ValueError):
+            # Empty or undecodable document - keep whatever was collected
+            page.close()
+        return page
+    
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        """Join the page text strings (same as BeautifulSoup's get_text)."""
+        if strip:
+            return separator.join(s for s in (s.strip() for s in self.strings) if s)
+        return separator.join(self.strings)
+    
+    def _flush(self):
+        """Turn buffered character data into one string."""
+        if not self._data:
+            return
+        text = ''.join(self._data)
+        self._data = []
+        if not self._preserve_depth and not text.strip(self.ASCII_SPACES):
+            text = '\n' if '\n' in text else ' '
+        
+        if self._stack and self._stack[-1][0] in ('title', 'script'):
+            self._current_text = text
+        if self._non_text_depth:
+            return
+        
+        self.strings.append(text)
+        stripped = text.strip()
+        if stripped:
+            for collector in self._collectors:
+                collector.append(stripped)
+    
+    # lxml parser target interface
+    
+    def start(self, tag, attrib):
+        self._flush()
+        collector = None
+        if tag == 'a' and attrib.get('href') is not None:
+            collector = []
+            self.links.append((attrib['href'], collector))
+        if attrib.get('data-email') is not None:
+            if collector is None:
+                collector = []
+            self.data_emails.append((attrib['data-email'], collector))
+        if collector is not None:
+            self._collectors.append(collector)
+        if tag == 'meta' and attrib.get('content') is not None:
+            self.meta_contents.append(attrib['content'])
+        
+        if tag in ('title', 'script'):
+            self._current_text = None
+        if tag in self.NON_TEXT_TAGS:
+            self._non_text_depth += 1
+        if tag in self.PRESERVE_WHITESPACE_TAGS:
+            self._preserve_depth += 1
+        self._stack.append((tag, collector))
+    
+    def end(self, tag):
+        self._flush()
+        # Close everything up to the most recent matching open tag
+        for i in range(len(self._stack) - 1, -1, -1):
+            if self._stack[i][0] == tag:
+                break
+        else:
+            return
+        while len(self._stack) > i:
+            name, collector = self._stack.pop()
+            if collector is not None:
+                self._collectors.remove(collector)
+            if name in self.NON_TEXT_TAGS:
+                self._non_text_depth -= 1
+            if name in self.PRESERVE_WHITESPACE_TAGS:
+                self._preserve_depth -= 1
+            if name == 'title' and not self._title_seen:
+                self._title_seen = True
+                self.title = self._current_text
+            elif name == 'script':
+                self.scripts.append(self._current_text)
+    
+    def data(self, data):
+        self._data.append(data)
+    
+    def comment(self, text):
+        self._flush()
+    
+    def pi(self, target, data=None):
+        self._flush()
+    
+    def doctype(self, *args):
+        self._flush()
+    
+    def close(self):
+        self._flush()
+        while self._stack:
+            self.end(self._stack[-1][0])
+        return self
+
+
+class PlaywrightPool:
+    """A few long-lived headless Chromium browsers shared by all crawl threads.
+    
+    Launching Chromium takes a second or more, so browsers are started once and
+    each page only gets a fresh context. Playwright's sync API must stay on the
+    thread that started it, so every browser lives on its own single-thread
+    executor and pages are handed to those executors round-robin.
+    """
+    
+    # Resource types that never contain emails or links
+    BLOCKED_RESOURCE_TYPES = frozenset(['image', 'media', 'font'])
+    
+    def __init__(self, size: int):
+        self._executors = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"playwright-{i}")
+            for i in range(max(1, size))
+        ]
+        self._next_executor = itertools.count()
+        self._state = local()  # Playwright + browser of the executor thread
+    
+    def run(self, fn, *args, timeout: Optional[float] = None):
+        """Call fn(browser, *args) on one of the browser threads and return its result.
+        
+        Raises concurrent.futures.TimeoutError if the result is not ready within timeout
+        seconds (waiting for the browser included); a call still queued is then dropped.
+        """
+        executor = self._executors[next(self._next_executor) % len(self._executors)]
+        future = executor.submit(self._call, fn, *args)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeout:
+            future.cancel()  # No-op if the render already started - its result is dropped
+            raise
+    
+    def _call(self, fn, *args):
+        browser = getattr(self._state, 'browser', None)
+        if browser is None or not browser.is_connected():
+            self._stop_browser()
+            self._state.playwright = sync_playwright().start()
+            self._state.browser = self._state.playwright.chromium.launch(headless=True)
+        return fn(self._state.browser, *args)
+    
+    def _stop_browser(self):
+        browser = getattr(self._state, 'browser', None)
+        playwright = getattr(self._state, 'playwright', None)
+        self._state.browser = self._state.playwright = None
+        try:
+            if browser is not None:
+                browser.close()
+        except Exception:
+            pass  # Browser already gone
+        try:
+            if playwright is not None:
+                playwright.stop()
+        except Exception:
+            pass
+    
+    def close(self):
+        """Close every browser on its own thread and stop the executors."""
+        for executor in self._executors:
+            try:
+                executor.submit(self._stop_browser).result()
+            except Exception:
+                pass
+            executor.shutdown(wait=True)
+    
+    @classmethod
+    def block_heavy_resources(cls, route):
+        """Route handler that skips images, media and fonts."""
+        if route.request.resource_type in cls.BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
 
 class EmailScraper:
     """Scraper for extracting .dz emails from university websites."""
     
     def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers if max_workers is not None else MAX_WORKERS
+        
+        # Resolve each host once per DNS_CACHE_TTL_SECONDS instead of on every new connection
+        self.dns_cache = DnsCache(DNS_CACHE_TTL_SECONDS, DNS_NEGATIVE_TTL_SECONDS, DNS_CACHE_SIZE)
+        self.dns_cache.install()
+        
         # Create session with connection pooling and retry strategy
         self.session = requests.Session()
+        # User-Agents are rotated in a fixed (shuffled once) order, see fetch_html
+        self._user_agents = itertools.cycle(random.sample(USER_AGENTS, len(USER_AGENTS)))
+        self._request_counter = itertools.count()
         self._rotate_user_agent()
+        # Add realistic browser headers to avoid detection (same for every request)
+        self.session.headers.update(BROWSER_HEADERS)
         self.session.verify = False  # Disable SSL verification for .dz sites
         
         # Configure retry strategy for robustness
@@ -63,10 +515,14 @@ class EmailScraper:
             status_forcelist=[500, 502, 503, 504],
             allowed_methods=["GET"]
         )
+        # Keep at least one pooled connection per worker thread, otherwise extra
+        # connections are discarded after each request and pay a new TLS handshake.
+        # A crawl touches many hosts at once (www/non-www, ~20 department subdomains),
+        # so keep a pool per host rather than evicting after 10 and reconnecting
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=20
+            pool_connections=HTTP_POOL_HOSTS,
+            pool_maxsize=max(20, self.max_workers)
         )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
@@ -77,30 +533,81 @@ class EmailScraper:
         self.robots_session.headers.update({'User-Agent': self.session.headers.get('User-Agent', USER_AGENT)})
         # No retry adapter for robots.txt - fail fast (max_retries=0)
         no_retry_strategy = Retry(total=0)  # No retries at all
-        no_retry_adapter = HTTPAdapter(max_retries=no_retry_strategy, pool_connections=5, pool_maxsize=10)
+        no_retry_adapter = HTTPAdapter(max_retries=no_retry_strategy)
+        # Share the page adapter's connection pools (retries are applied per request, not
+        # per pool), so the robots.txt connection is reused for the first pages of a host
+        no_retry_adapter.poolmanager = adapter.poolmanager
         self.robots_session.mount("http://", no_retry_adapter)
         self.robots_session.mount("https://", no_retry_adapter)
         
         # Thread-safe data structures
-        self.visited_urls: Set[str] = set()
+        # Visited URLs are stored as 64-bit hashes (see _visited_key), not strings,
+        # since this set grows with every page of every seed
+        self.visited_urls: Set[int] = set()
         self.visited_lock = Lock()
-        self.robots_cache: Dict[str, Optional[urllib.robotparser.RobotFileParser]] = {}
+        # LRU of base domain -> (expires_at, parser); None entries are failed fetches
+        self.robots_cache: "OrderedDict[str, Tuple[float, Optional[urllib.robotparser.RobotFileParser]]]" = OrderedDict()
         self.robots_lock = Lock()
-        self.email_pattern = re.compile(r'[\w.\-+%]+@[\w.\-]+\.dz\b', re.IGNORECASE)
-        self.max_workers = max_workers if max_workers is not None else MAX_WORKERS
-        
-        # HTML parser preference (lxml is faster, fallback to html.parser)
-        try:
-            import lxml
-            self.html_parser = 'lxml'
-        except ImportError:
-            self.html_parser = 'html.parser'
-            logger.warning("lxml not available, using html.parser (slower). Install with: pip install lxml")
+        # Base domain -> earliest time (monotonic) its next request may start
+        self._host_next_fetch: Dict[str, float] = {}
+        self._host_lock = Lock()
+        # Lookbehind anchors each attempt to the start of a local-part run, so long
+        # words without '@' are scanned once instead of once per character.
+        # A match may also start right after '.dz': that is where the previous match
+        # ended, and back-to-back addresses (x@a.dz.b@c.dz) are still both found.
+        # Groups: 1 = local part, 2 = domain
+        self.email_pattern = re.compile(r'(?:(?<![\w.\-+%])|(?<=\.dz))([\w.\-+%]+)@([\w.\-]+\.dz)\b', re.IGNORECASE)
+        # Excluded patterns are lowercase; matched as substrings of the lowercased local part
+        self.contains_excluded_pattern = build_substring_matcher([p.lower() for p in EXCLUDED_EMAIL_PATTERNS])
+        # Local part -> is_institutional_email decision
+        self._institutional_cache: Dict[str, bool] = {}
+        # URLs written in page text: each match is a whole URL-like run (one linear pass,
+        # no backtracking to look for '.dz'); runs without '.dz' are dropped afterwards
+        self.text_url_pattern = re.compile(r'https?://[^\s<>"\']+', re.IGNORECASE)
+        # Login/admin hrefs and URLs (matched lowercased) - the one skip list for links and pages
+        self.skip_href_pattern = re.compile(r'/user\?|/login|/admin|admin_panel|[?&]login=')
+        # Lowercased URLs with these words are never teacher name pages
+        self.non_teacher_url_pattern = re.compile(r'websites|contact|page|admin|login')
+        # Raw-HTML prefilter: an '@' that can end a local part (not CSS '@media' after
+        # whitespace/braces), or an entity-encoded '@' (&#64; &#x40; &commat;).
+        # Every branch starts with a literal ('@' or '&'), so re skips ahead to those
+        # characters instead of trying each branch at every position
+        self.email_hint_pattern = re.compile(r'@(?<![\s{};>]@)|&(?:#?\w+;@|#0*64|#x0*40|commat)', re.IGNORECASE)
+        # Second prefilter, run only when the first one hits: every extracted address ends
+        # in '.dz', possibly with each character entity-encoded (WordPress antispambot)
+        self.dz_hint_pattern = re.compile(
+            r'(?:\.|&#0*46;?|&#x0*2e;?|&period;)(?:d|&#0*100;?|&#x0*64;?)(?:z|&#0*122;?|&#x0*7a;?)',
+            re.IGNORECASE
+        )
+        # Browsers for JS-rendered pages, launched on first use and reused across pages
+        self.playwright_pool = PlaywrightPool(PLAYWRIGHT_WORKERS)
+        # Optional HTTP cache kept on disk between runs
+        self.disk_cache = None
+        if USE_DISK_CACHE:
+            ensure_dir(DISK_CACHE_FILE.parent)
+            self.disk_cache = DiskCache(DISK_CACHE_FILE)
+        # Raw email batches are written by a background thread, so crawling never waits
+        # on CSV formatting or disk I/O. A plain OUTPUT_RAW is opened on the first batch
+        # and kept open until close(); a gzipped one gets a new member per batch
+        self._raw_file = None
+        self._raw_writer = None
+        self._raw_output_checked = False
+        self._raw_queue: "Queue[Optional[List[Dict]]]" = Queue()
+        self._raw_writer_thread = Thread(target=self._raw_writer_loop, name="raw-csv-writer", daemon=True)
+        self._raw_writer_thread.start()
+        # The writer is a daemon thread - close() at exit writes out whatever is still
+        # queued if the caller never closed the scraper
+        self._closed = False
+        atexit.register(self.close)
+    
+    @staticmethod
+    def _visited_key(url: str) -> int:
+        """Key for visited_urls: a 64-bit hash of the URL (collisions are negligible below billions of URLs)."""
+        return hash(url)
     
     def _rotate_user_agent(self):
         """Rotate User-Agent header to avoid detection."""
-        user_agent = random.choice(USER_AGENTS)
-        self.session.headers.update({'User-Agent': user_agent})
+        self.session.headers['User-Agent'] = next(self._user_agents)
         
     def load_seeds(self) -> List[str]:
         """Load seed URLs from seeds.txt."""
@@ -120,26 +627,36 @@ class EmailScraper:
     
     def get_robots_parser(self, url: str) -> Optional[urllib.robotparser.RobotFileParser]:
         """Get robots.txt parser for a domain (cached, thread-safe, fast-fail)."""
-        parsed = urlparse(url)
+        parsed = _parse_url(url)
         original_host = parsed.netloc or ""
         if not original_host:
             return None
         
         # Cache robots per base domain (normalized without www and subdomains)
         # Use base domain so subdomains share the same robots.txt
-        host = self._strip_www(original_host)
         # Extract base domain (e.g., 'univ-annaba.dz' from 'staff.univ-annaba.dz')
-        parts = host.split('.')
-        if len(parts) >= 2 and parts[-1] == 'dz':
-            base_domain = '.'.join(parts[-2:])  # Get last 2 parts
-        else:
-            base_domain = host
+        base_domain = _get_base_domain(_strip_www(original_host))
         cache_key = base_domain
         
-        # Check cache first (thread-safe)
+        # Check cache first. A hit needs no lock: get() and move_to_end() are single
+        # C-level OrderedDict calls, atomic under the GIL
+        entry = self.robots_cache.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            try:
+                self.robots_cache.move_to_end(cache_key)
+            except KeyError:
+                pass  # Evicted by another thread just now - the parser is still valid
+            return entry[1]
+        
+        # Miss or expired: drop the expired entry (the check-and-delete needs the lock)
         with self.robots_lock:
-            if cache_key in self.robots_cache:
-                return self.robots_cache[cache_key]
+            entry = self.robots_cache.get(cache_key)
+            if entry is not None:
+                expires_at, cached_rp = entry
+                if expires_at > time.monotonic():
+                    self.robots_cache.move_to_end(cache_key)
+                    return cached_rp
+                del self.robots_cache[cache_key]
         
         rp = urllib.robotparser.RobotFileParser()
         
@@ -147,30 +664,65 @@ class EmailScraper:
         # Use shorter timeout and no retries for robots.txt
         # All .dz sites use HTTPS - only try HTTPS
         robots_url = f"https://{base_domain}/robots.txt"
+        
+        # Reuse a robots.txt fetched by an earlier run while it is still fresh
+        cached = self.disk_cache.get(robots_url, max_age=ROBOTS_CACHE_TTL_SECONDS) if self.disk_cache else None
+        if cached is not None:
+            rp.parse(cached.body.decode(cached.encoding or 'utf-8', errors='ignore').splitlines())
+            self._cache_robots_parser(cache_key, rp)
+            return rp
+        
         try:
             resp = self.robots_session.get(
                 robots_url,
                 timeout=(2.0, 3.0),  # Very short timeout for robots.txt
                 allow_redirects=True,
+                stream=True,
             )
-            if resp.status_code == 200:
-                rp.parse(resp.text.splitlines())
+            if resp.status_code != 200:
+                resp.close()
+            else:
+                self._read_capped_body(resp, ROBOTS_MAX_BYTES)
+                if self.disk_cache is not None:
+                    self.disk_cache.put(robots_url, resp.content, encoding=resp.encoding)
+                robots_text = resp.content.decode(resp.encoding or 'utf-8', errors='ignore')
+                rp.parse(robots_text.splitlines())
                 logger.debug(f"Loaded robots.txt from {robots_url}")
-                with self.robots_lock:
-                    self.robots_cache[cache_key] = rp
+                self._cache_robots_parser(cache_key, rp)
                 return rp
         except (requests.exceptions.Timeout, requests.exceptions.ConnectionError, 
                 requests.exceptions.RequestException, Exception):
             pass  # robots.txt not available
         
-        # If all attempts failed, cache None to avoid retrying
-        with self.robots_lock:
-            self.robots_cache[cache_key] = None
+        # If all attempts failed, cache None to avoid retrying (for a shorter time)
+        self._cache_robots_parser(cache_key, None)
         return None
+    
+    def prefetch_robots(self, urls: List[str]):
+        """Warm the robots.txt cache for many URLs concurrently (one fetch per base domain)."""
+        one_url_per_domain = {}
+        for url in urls:
+            netloc = _parse_url(self.normalize_url(url)).netloc
+            if netloc:
+                one_url_per_domain.setdefault(_get_base_domain(_strip_www(netloc)), url)
+        if not one_url_per_domain:
+            return
+        with ThreadPoolExecutor(max_workers=min(ROBOTS_PREFETCH_WORKERS, len(one_url_per_domain))) as executor:
+            list(executor.map(self.get_robots_parser, one_url_per_domain.values()))
+        logger.info(f"Prefetched robots.txt for {len(one_url_per_domain)} domains")
+    
+    def _cache_robots_parser(self, cache_key: str, rp: Optional[urllib.robotparser.RobotFileParser]):
+        """Store a robots.txt parser (or a failed fetch) in the size-bounded TTL cache."""
+        ttl = ROBOTS_CACHE_TTL_SECONDS if rp is not None else ROBOTS_NEGATIVE_TTL_SECONDS
+        with self.robots_lock:
+            self.robots_cache[cache_key] = (time.monotonic() + ttl, rp)
+            self.robots_cache.move_to_end(cache_key)
+            while len(self.robots_cache) > ROBOTS_CACHE_SIZE:
+                self.robots_cache.popitem(last=False)  # Evict least recently used host
 
     def _strip_www(self, netloc: str) -> str:
         """Remove leading 'www.' from a hostname."""
-        return netloc[4:] if netloc.startswith("www.") else netloc
+        return _strip_www(netloc)
     
     def can_fetch(self, url: str) -> bool:
         """Check if URL can be fetched according to robots.txt. Returns True to ignore robots.txt restrictions."""
@@ -189,32 +741,57 @@ class EmailScraper:
         delay = rp.crawl_delay(current_ua)
         return delay if delay else REQUEST_DELAY_DEFAULT
     
+    def robots_decision(self, url: str) -> Tuple[bool, float]:
+        """Return (allowed, crawl delay) for a URL, resolving robots.txt only once."""
+        # can_fetch does not consult robots.txt, so the parser is only looked up for the delay
+        if not self.can_fetch(url):
+            return False, 0.0
+        return True, self.get_crawl_delay(url)
+    
+    def _wait_for_host_slot(self, url: str, delay: float):
+        """Sleep until the next request slot of this URL's base domain.
+        Slots are delay / max_workers apart, so a domain is crawled at the same average
+        rate as sleeping `delay` in each worker, but requests are spread out evenly
+        instead of going out in bursts (the first one without waiting)."""
+        scheme_and_base = _scheme_and_base_domain(url)
+        host = scheme_and_base[1] if scheme_and_base else url
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._host_next_fetch.get(host, now))
+            self._host_next_fetch[host] = slot + delay / self.max_workers
+        if slot > now:
+            time.sleep(slot - now)
+    
     def is_institutional_email(self, email: str) -> bool:
         """Check if email is an institutional/support/administrative email (not a personal teacher email)."""
         # Safety check - email must have @
         if '@' not in email:
             return False  # Not an email, can't be institutional
         
-        try:
-            local_part = email.split('@')[0].lower()
-        except (ValueError, IndexError):
-            return False  # Malformed email, skip
-        
-        # Check against excluded patterns (case-insensitive substring match)
-        for pattern in EXCLUDED_EMAIL_PATTERNS:
-            pattern_lower = pattern.lower()
-            if pattern_lower in local_part:
-                return True
+        local_part = email.partition('@')[0].lower()
+        
+        # The same addresses show up on page after page - decide once per local part
+        decision = self._institutional_cache.get(local_part)
+        if decision is None:
+            decision = self._is_institutional_local_part(local_part)
+            if len(self._institutional_cache) >= INSTITUTIONAL_CACHE_SIZE:
+                self._institutional_cache.clear()
+            self._institutional_cache[local_part] = decision
+        return decision
+    
+    def _is_institutional_local_part(self, local_part: str) -> bool:
+        """Institutional check on a lowercased local part (see is_institutional_email)."""
+        # Check against excluded patterns (case-insensitive substring match, one scan)
+        if self.contains_excluded_pattern(local_part):
+            return True
         
         # Exclude emails that are too short (likely generic)
         if len(local_part) < 3:
             return True
         
         # Exclude emails starting with admin prefixes (vr., doyen., chef., etc.)
-        admin_prefixes = ['vr.', 'doyen.', 'chef.', 'directeur.', 'director.', 'admin.', 'service.']
-        for prefix in admin_prefixes:
-            if local_part.startswith(prefix):
-                return True
+        if local_part.startswith(ADMIN_LOCAL_PART_PREFIXES):
+            return True
         
         # Exclude short abbreviations (2-4 chars) that are likely admin codes
         if len(local_part) <= 4 and '.' not in local_part and '-' not in local_part:
@@ -225,44 +802,61 @@ class EmailScraper:
         return False
     
     def extract_emails_from_text(self, text: str, source_url: str, source_type: str, 
-                                  page_title: str = "") -> List[Dict]:
-        """Extract .dz emails from text with context."""
-        emails = []
-        for match in self.email_pattern.finditer(text):
-            email = match.group(0).lower()
-            start, end = match.span()
+                                  page_title: str = "", seen: Optional[Set[str]] = None) -> List[Dict]:
+        """Extract .dz emails from text with context.
+        Emails already in `seen` are skipped, and returned emails are added to it."""
+        if seen is None:
+            seen = set()
+        candidates = self._text_candidates(text, f'regex_{source_type}')
+        return list(self._email_records(candidates, source_url, source_type, page_title, seen))
+    
+    def _email_records(self, candidates: Iterable[Tuple[str, str, str, str, str]], source_url: str,
+                       source_type: str, page_title: str, seen: Set[str]) -> Iterator[Dict]:
+        """Turn (email, local_part, domain, context, parse_method) candidates into CSV records.
+        Institutional emails and emails already in `seen` are skipped before any dict is built."""
+        # Same for every email on the page
+        title = page_title[:200] if page_title else ""
+        found_at = datetime.utcnow().isoformat()
+        # Bound once - looked up for every candidate otherwise
+        is_institutional = self.is_institutional_email
+        seen_add = seen.add
+        log_skipped = logger.isEnabledFor(logging.DEBUG)
+        
+        for email, local_part, domain, context, parse_method in candidates:
+            if email in seen:
+                continue  # Already found on this page - don't build a second record
             
             # Skip institutional/support emails
-            if self.is_institutional_email(email):
-                logger.debug(f"Skipping institutional email: {email}")
-                continue
-            
-            # Get context snippet (100 chars before/after)
-            context_start = max(0, start - 100)
-            context_end = min(len(text), end + 100)
-            context = text[context_start:context_end].strip()
-            
-            # Parse email parts (regex ensures @ exists, but add safety check)
-            try:
-                local_part, domain = email.split('@', 1)
-            except ValueError:
-                logger.debug(f"Skipping malformed email from regex: {email}")
+            if is_institutional(email):
+                if log_skipped:
+                    logger.debug(f"Skipping institutional email: {email}")
                 continue
             
-            emails.append({
+            seen_add(email)
+            yield {
                 'email': email,
                 'local_part': local_part,
                 'domain': domain,
                 'source_url': source_url,
                 'source_type': source_type,
-                'page_title': page_title[:200] if page_title else "",
+                'page_title': title,
                 'context_snippet': context[:200],
-                'found_at': datetime.utcnow().isoformat(),
-                'parse_method': f'regex_{source_type}',
+                'found_at': found_at,
+                'parse_method': parse_method,
                 'notes': ''
-            })
-        
-        return emails
+            }
+    
+    def _text_candidates(self, text: str, parse_method: str) -> Iterator[Tuple[str, str, str, str, str]]:
+        """Emails matched in plain text, with 100 chars of context before/after."""
+        if '@' not in text:
+            return  # No match possible - skip the regex scan
+        for match in self.email_pattern.finditer(text):
+            start, end = match.span()
+            # Email parts come straight from the regex groups (one call for all three)
+            email, local_part, domain = match.group(0, 1, 2)
+            # (slicing past the end is clamped, no need for min(len(text), ...))
+            context = text[max(0, start - 100):end + 100].strip()
+            yield email.lower(), local_part.lower(), domain.lower(), context, parse_method
     
     def fetch_html(self, url: str, retries: int = RETRY_ATTEMPTS) -> Optional[requests.Response]:
         """Fetch HTML page with retries and robust .dz domain handling."""
@@ -337,36 +931,47 @@ class EmailScraper:
             
             for attempt in range(current_retries):
                 try:
-                    # Rotate User-Agent periodically
-                    if attempt == 0 or random.random() < 0.3:
+                    # Rotate User-Agent every UA_ROTATE_EVERY requests, and on every retry
+                    if attempt > 0 or next(self._request_counter) % UA_ROTATE_EVERY == 0:
                         self._rotate_user_agent()
                     
-                    # Add realistic browser headers to avoid detection
-                    headers = {
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'DNT': '1',
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1',
-                        'Sec-Fetch-Dest': 'document',
-                        'Sec-Fetch-Mode': 'navigate',
-                        'Sec-Fetch-Site': 'none',
-                        'Cache-Control': 'max-age=0',
-                        'Referer': 'https://www.google.com/',  # Fake referer
-                    }
-                    self.session.headers.update(headers)
-                    
                     # Add random delay before request (human-like)
                     if attempt > 0:
                         time.sleep(random.uniform(2, 5))
                     
+                    # Revalidate a page kept from an earlier run instead of downloading it again
+                    cached = self.disk_cache.get(url_to_try) if self.disk_cache else None
+                    conditional_headers = {}
+                    if cached is not None:
+                        if cached.etag:
+                            conditional_headers['If-None-Match'] = cached.etag
+                        if cached.last_modified:
+                            conditional_headers['If-Modified-Since'] = cached.last_modified
+                    
+                    # Stream the body so non-HTML files and huge pages are never fully downloaded
                     response = self.session.get(
                         url_to_try,
+                        headers=conditional_headers,
                         timeout=(CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS),
                         allow_redirects=True,
+                        stream=True,
                     )
+                    if response.status_code == 304 and cached is not None:
+                        # Not modified - serve the stored body
+                        response.close()
+                        response._content = cached.body
+                        response.encoding = cached.encoding
+                        self.disk_cache.touch(url_to_try)
+                        return response
+                    if not response.ok:
+                        response.close()
                     response.raise_for_status()
+                    if not self._is_html_response(response):
+                        logger.debug(f"Skipping {url_to_try} - not HTML ({response.headers.get('Content-Type')})")
+                        response.close()
+                        return None
+                    self._read_capped_body(response)
+                    self._store_in_disk_cache(url_to_try, response)
                     return response
                 except requests.exceptions.HTTPError as e:
                     # Don't retry 404 or 403
@@ -439,279 +1044,180 @@ class EmailScraper:
         
         return None
     
-    def extract_emails_from_html(self, html: str, url: str) -> List[Dict]:
-        """Extract emails from HTML page - checks multiple sources."""
-        try:
-            soup = BeautifulSoup(html, self.html_parser)
-        except Exception:
-            # Fallback to html.parser if lxml fails
-            soup = BeautifulSoup(html, 'html.parser')
-        page_title = soup.title.string if soup.title else ""
+    def _is_html_response(self, response: requests.Response) -> bool:
+        """Check the Content-Type header so PDFs, images and archives are not downloaded."""
+        content_type = response.headers.get('Content-Type', '').lower()
+        if not content_type:
+            return True  # No header - assume HTML, as before
+        return content_type.startswith('text/') or 'html' in content_type or 'xml' in content_type
+    
+    def _read_capped_body(self, response: requests.Response, max_bytes: int = MAX_PAGE_BYTES):
+        """Read a streamed response body, stopping after max_bytes."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                logger.debug(f"Truncated {response.url} at {max_bytes} bytes")
+                break
+        # Hand the bytes back to requests so response.text/.content work as usual
+        response._content = b''.join(chunks)[:max_bytes]
+        response.close()
+    
+    def _store_in_disk_cache(self, url: str, response: requests.Response):
+        """Keep a fetched page on disk if the server gave validators to revalidate it with."""
+        if self.disk_cache is None:
+            return
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self.disk_cache.put(url, response.content, etag, last_modified, response.encoding)
+    
+    def extract_emails_from_html(self, html: str, url: str, page: Optional[PageContent] = None) -> List[Dict]:
+        """Extract emails from HTML page - checks multiple sources.
+        Pass an already parsed page to avoid parsing the same HTML twice."""
+        # Most crawled pages have no email at all - reject them on the raw HTML
+        # before walking links, attributes, text and scripts (and before parsing,
+        # when no parsed page was passed in)
+        if not self.email_hint_pattern.search(html) or not self.dz_hint_pattern.search(html):
+            return []
+        if page is None:
+            page = PageContent.parse(html)
+        page_title = page.title or ""
+        text = page.get_text(separator=' ', strip=True)
+        
+        # All sources feed one pipeline, in priority order:
+        # 1. mailto: links, 2. data attributes (data-email, data-contact, etc.),
+        # 3. meta tags, 4. all text content (main extraction method),
+        # 5. script tags (JSON-LD, JavaScript variables, etc.)
+        # The same address usually shows up in several of them - only its first
+        # occurrence becomes a record
+        candidates = itertools.chain(
+            self._mailto_candidates(page),
+            self._data_attribute_candidates(page),
+            self._meta_candidates(page),
+            self._text_candidates(text, 'regex_html'),
+            self._script_candidates(page),
+        )
+        all_emails = list(self._email_records(candidates, url, 'html', page_title, set()))
         
-        all_emails = []
+        # Debug: Log email extraction results
+        text_count = sum(1 for e in all_emails if e['parse_method'] == 'regex_html')
+        if text_count:
+            logger.info(f"Found {text_count} emails in text content for {url}")
+        elif '@' in text and '.dz' in text:
+            # If we see @ and .dz but no emails found, might be filtered or wrong format
+            logger.debug(f"Found @ and .dz in text but no emails extracted from {url} (might be filtered)")
         
-        # 1. Extract from mailto: links
-        for link in soup.find_all('a', href=True):
-            href = link['href']
+        return all_emails
+    
+    def _mailto_candidates(self, page: PageContent) -> Iterator[Tuple[str, str, str, str, str]]:
+        """Emails from mailto: links, with the link text as context."""
+        for href, link_text in page.links:
             if href.startswith('mailto:'):
                 email = href.replace('mailto:', '').split('?')[0].strip()
                 if '@' in email and email.endswith('.dz'):
                     email_lower = email.lower()
-                    if not self.is_institutional_email(email_lower):
-                        try:
-                            local_part, domain = email_lower.split('@', 1)
-                            all_emails.append({
-                                'email': email_lower,
-                                'local_part': local_part,
-                                'domain': domain,
-                                'source_url': url,
-                                'source_type': 'html',
-                                'page_title': page_title[:200] if page_title else "",
-                                'context_snippet': link.get_text(strip=True)[:200],
-                                'found_at': datetime.utcnow().isoformat(),
-                                'parse_method': 'mailto_link',
-                                'notes': ''
-                            })
-                        except ValueError:
-                            continue
-        
-        # 2. Extract from data attributes (data-email, data-contact, etc.)
-        for tag in soup.find_all(attrs={'data-email': True}):
-            email = tag.get('data-email', '').strip()
+                    # Not a regex match - partition returns both parts without building a list
+                    local_part, _, domain = email_lower.partition('@')
+                    yield email_lower, local_part, domain, ''.join(link_text), 'mailto_link'
+    
+    def _data_attribute_candidates(self, page: PageContent) -> Iterator[Tuple[str, str, str, str, str]]:
+        """Emails from data-email/data-contact style attributes, with the tag text as context."""
+        for data_email, tag_text in page.data_emails:
+            email = data_email.strip()
             if '@' in email and email.endswith('.dz'):
                 email_lower = email.lower()
-                if not self.is_institutional_email(email_lower):
-                    try:
-                        local_part, domain = email_lower.split('@', 1)
-                        all_emails.append({
-                            'email': email_lower,
-                            'local_part': local_part,
-                            'domain': domain,
-                            'source_url': url,
-                            'source_type': 'html',
-                            'page_title': page_title[:200] if page_title else "",
-                            'context_snippet': tag.get_text(strip=True)[:200],
-                            'found_at': datetime.utcnow().isoformat(),
-                            'parse_method': 'data_attribute',
-                            'notes': ''
-                        })
-                    except ValueError:
-                        continue
-        
-        # 3. Extract from meta tags (some sites put contact emails in meta)
-        for meta in soup.find_all('meta', attrs={'content': True}):
-            content = meta.get('content', '')
+                local_part, _, domain = email_lower.partition('@')
+                yield email_lower, local_part, domain, ''.join(tag_text), 'data_attribute'
+    
+    def _meta_candidates(self, page: PageContent) -> Iterator[Tuple[str, str, str, str, str]]:
+        """Emails in meta tag contents (some sites put contact emails in meta)."""
+        for content in page.meta_contents:
             if '@' in content and '.dz' in content:
-                # Use regex to find emails in meta content
                 for match in self.email_pattern.finditer(content):
-                    email = match.group(0).lower()
-                    if not self.is_institutional_email(email):
-                        try:
-                            local_part, domain = email.split('@', 1)
-                            all_emails.append({
-                                'email': email,
-                                'local_part': local_part,
-                                'domain': domain,
-                                'source_url': url,
-                                'source_type': 'html',
-                                'page_title': page_title[:200] if page_title else "",
-                                'context_snippet': content[:200],
-                                'found_at': datetime.utcnow().isoformat(),
-                                'parse_method': 'meta_tag',
-                                'notes': ''
-                            })
-                        except ValueError:
-                            continue
-        
-        # 4. Extract from all text content (main extraction method)
-        text = soup.get_text(separator=' ', strip=True)
-        text_emails = self.extract_emails_from_text(text, url, 'html', page_title)
-        all_emails.extend(text_emails)
-        
-        # Debug: Log email extraction results
-        if text_emails:
-            logger.info(f"Found {len(text_emails)} emails in text content for {url}")
-        elif '@' in text and '.dz' in text:
-            # If we see @ and .dz but no emails found, might be filtered or wrong format
-            logger.debug(f"Found @ and .dz in text but no emails extracted from {url} (might be filtered)")
-        
-        # 5. Extract from script tags (JSON-LD, JavaScript variables, etc.)
-        for script in soup.find_all('script'):
-            if script.string:
-                script_text = script.string
+                    email, local_part, domain = match.group(0, 1, 2)
+                    yield email.lower(), local_part.lower(), domain.lower(), content, 'meta_tag'
+    
+    def _script_candidates(self, page: PageContent) -> Iterator[Tuple[str, str, str, str, str]]:
+        """Emails inside script tags, with 50 chars of context before/after."""
+        for script_text in page.scripts:
+            if script_text and '@' in script_text:
                 for match in self.email_pattern.finditer(script_text):
-                    email = match.group(0).lower()
-                    if not self.is_institutional_email(email):
-                        try:
-                            local_part, domain = email.split('@', 1)
-                            all_emails.append({
-                                'email': email,
-                                'local_part': local_part,
-                                'domain': domain,
-                                'source_url': url,
-                                'source_type': 'html',
-                                'page_title': page_title[:200] if page_title else "",
-                                'context_snippet': script_text[max(0, match.start()-50):match.end()+50][:200],
-                                'found_at': datetime.utcnow().isoformat(),
-                                'parse_method': 'script_tag',
-                                'notes': ''
-                            })
-                        except ValueError:
-                            continue
-        
-        # Deduplicate emails found from same page
-        seen_emails = set()
-        unique_emails = []
-        for email_dict in all_emails:
-            email_key = email_dict['email']
-            if email_key not in seen_emails:
-                seen_emails.add(email_key)
-                unique_emails.append(email_dict)
-        
-        return unique_emails
+                    start, end = match.span()
+                    email, local_part, domain = match.group(0, 1, 2)
+                    context = script_text[max(0, start - 50):end + 50]
+                    yield email.lower(), local_part.lower(), domain.lower(), context, 'script_tag'
     
     def fetch_html_with_playwright(self, url: str) -> Optional[str]:
         """Fetch HTML using Playwright for JavaScript-rendered pages."""
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                try:
-                    page = browser.new_page()
-                    # Playwright timeout is in milliseconds
-                    # Use 'domcontentloaded' first, then wait a bit for JS to render
-                    page.goto(url, wait_until='domcontentloaded', timeout=int(TIMEOUT_SECONDS * 1000))
-                    # Wait a bit for JavaScript to render content (especially for /websites pages)
-                    page.wait_for_timeout(3000)  # Wait 3 seconds for JS to render
-                    # Try to wait for content to load (if there are specific selectors)
-                    try:
-                        # Wait for table or main content to appear
-                        page.wait_for_selector('table, main, .content', timeout=5000)
-                    except:
-                        pass  # Continue even if selector doesn't appear
-                    html = page.content()
-                    # Also get the rendered text to check for emails
-                    text_content = page.inner_text('body')
-                    page_title = page.title()
-                    
-                    # Debug: Check if page loaded correctly
-                    if '403' in page_title or 'forbidden' in page_title.lower() or 'access denied' in text_content.lower():
-                        logger.warning(f"Playwright got 403/forbidden page for {url}")
-                    else:
-                        logger.info(f"Playwright loaded page successfully: {page_title[:50]}")
-                    
-                    # Debug: Check for email-like content
-                    email_count = text_content.count('@')
-                    dz_count = text_content.count('.dz')
-                    if email_count > 0 and dz_count > 0:
-                        logger.info(f"Found {email_count} '@' symbols and {dz_count} '.dz' in page text for {url}")
-                    elif email_count > 0:
-                        logger.debug(f"Found {email_count} '@' symbols but no '.dz' in page text for {url}")
-                    
-                    return html
-                finally:
-                    # Ensure browser is closed even on exception
-                    browser.close()
+            return self.playwright_pool.run(self._render_with_browser, url, timeout=PLAYWRIGHT_TIMEOUT_SECONDS)
         except PlaywrightTimeout:
             logger.warning(f"Playwright timeout for {url}")
             return None
+        except FutureTimeout:
+            logger.warning(f"Playwright gave up on {url} after {PLAYWRIGHT_TIMEOUT_SECONDS:.0f}s (waiting for a free browser included)")
+            return None
         except Exception as e:
             logger.error(f"Playwright error for {url}: {e}")
             return None
     
+    def _render_with_browser(self, browser, url: str) -> str:
+        """Render one page in a fresh context of a pooled browser (runs on the browser's thread)."""
+        context = browser.new_context()
+        try:
+            page = context.new_page()
+            page.route('**/*', PlaywrightPool.block_heavy_resources)
+            # Playwright timeout is in milliseconds
+            # Use 'domcontentloaded' first, then wait a bit for JS to render
+            page.goto(url, wait_until='domcontentloaded', timeout=int(TIMEOUT_SECONDS * 1000))
+            # Wait a bit for JavaScript to render content (especially for /websites pages)
+            page.wait_for_timeout(3000)  # Wait 3 seconds for JS to render
+            # Try to wait for content to load (if there are specific selectors)
+            try:
+                # Wait for table or main content to appear
+                page.wait_for_selector('table, main, .content', timeout=5000)
+            except:
+                pass  # Continue even if selector doesn't appear
+            html = page.content()
+            # Also get the rendered text to check for emails
+            text_content = page.inner_text('body')
+            page_title = page.title()
+            
+            # Debug: Check if page loaded correctly
+            if '403' in page_title or 'forbidden' in page_title.lower() or 'access denied' in text_content.lower():
+                logger.warning(f"Playwright got 403/forbidden page for {url}")
+            else:
+                logger.info(f"Playwright loaded page successfully: {page_title[:50]}")
+            
+            # Debug: Check for email-like content
+            email_count = text_content.count('@')
+            dz_count = text_content.count('.dz')
+            if email_count > 0 and dz_count > 0:
+                logger.info(f"Found {email_count} '@' symbols and {dz_count} '.dz' in page text for {url}")
+            elif email_count > 0:
+                logger.debug(f"Found {email_count} '@' symbols but no '.dz' in page text for {url}")
+            
+            return html
+        finally:
+            # Only the context is closed - the browser stays up for the next page
+            context.close()
+    
     def normalize_url(self, url: str) -> str:
         """Normalize URL to prevent duplicates (remove trailing slash, default scheme)."""
-        try:
-            parsed = urlparse(url)
-            # Skip if no netloc (invalid URL)
-            if not parsed.netloc:
-                return url
-            # Default to https if no scheme
-            scheme = parsed.scheme or 'https'
-            # Remove trailing slash from path (except root)
-            path = parsed.path.rstrip('/') or '/'
-            # Reconstruct URL
-            normalized = f"{scheme}://{parsed.netloc}{path}"
-            if parsed.query:
-                normalized += f"?{parsed.query}"
-            if parsed.fragment:
-                normalized += f"#{parsed.fragment}"
-            return normalized
-        except Exception:
-            return url
+        return normalize_url(url)
     
     def is_same_base_domain(self, url1: str, url2: str) -> bool:
         """Check if two URLs belong to the same base domain (including subdomains)."""
-        try:
-            parsed1 = urlparse(url1)
-            parsed2 = urlparse(url2)
-            
-            # Extract base domain (e.g., 'univ-batna2.dz' from 'staff.univ-batna2.dz')
-            def get_base_domain(netloc: str) -> str:
-                if not netloc:
-                    return ''
-                parts = netloc.split('.')
-                # For .dz domains, take last 2 parts (e.g., 'univ-batna2.dz')
-                # Handles: staff.univ-batna2.dz -> univ-batna2.dz
-                # Handles: mail.univ-tlemcen.dz -> univ-tlemcen.dz
-                if len(parts) >= 2 and parts[-1] == 'dz':
-                    return '.'.join(parts[-2:])
-                return netloc
-            
-            base1 = get_base_domain(parsed1.netloc)
-            base2 = get_base_domain(parsed2.netloc)
-            
-            # Both must have valid base domains
-            if not base1 or not base2:
-                return False
-            
-            # Allow http/https to be considered the same
-            schemes_match = (parsed1.scheme == parsed2.scheme or 
-                           (parsed1.scheme in ['http', 'https', ''] and 
-                            parsed2.scheme in ['http', 'https', '']))
-            
-            return base1 == base2 and schemes_match
-        except Exception:
-            return False
+        return is_same_base_domain(url1, url2)
     
-    def find_links_on_page(self, html: str, base_url: str) -> List[str]:
-        """Find all links on a page (for crawling), including subdomains."""
-        try:
-            soup = BeautifulSoup(html, self.html_parser)
-        except Exception:
-            soup = BeautifulSoup(html, 'html.parser')
-        
-        # Keywords that suggest pages with staff/contact information
-        priority_keywords = ['staff', 'websites', 'contact', 'personnel', 'enseignants', 
-                             'professeurs', 'equipe', 'team', 'annuaire', 'directory',
-                             'faculte', 'faculty', 'departement', 'department', 'corps',
-                             'enseignant', 'professeur', 'chercheur', 'researcher']
-        
-        # Keywords for faculties/majors/departments (critical for finding teacher emails)
-        faculty_keywords = [
-            'faculte', 'faculty', 'facultes', 'faculties',
-            'departement', 'department', 'departements', 'departments',
-            'filiere', 'filiere', 'specialite', 'speciality',
-            'formation', 'formation', 'domaine', 'domain',
-            'section', 'section', 'option', 'option',
-            'mathematiques', 'mathematics', 'math', 'fmath',
-            'informatique', 'computer', 'info', 'cs',
-            'physique', 'physics', 'phys',
-            'chimie', 'chemistry', 'chim',
-            'biologie', 'biology', 'bio',
-            'electronique', 'electronics', 'elec',
-            'mecanique', 'mechanical', 'meca',
-            'genie', 'engineering', 'civil', 'archi',
-            'economie', 'economics', 'eco',
-            'droit', 'law', 'juridique',
-            'lettres', 'literature', 'langues',
-            'philosophie', 'philosophy', 'philo',
-            'sociologie', 'sociology', 'socio',
-            'psychologie', 'psychology', 'psy',
-            'medecine', 'medicine', 'med',
-            'pharmacie', 'pharmacy', 'pharma',
-            'sciences', 'sciences', 'sci',
-            'islamiques', 'islamic', 'fsi'
-        ]
+    def find_links_on_page(self, html: str, base_url: str, page: Optional[PageContent] = None) -> List[str]:
+        """Find all links on a page (for crawling), including subdomains.
+        Pass an already parsed page to avoid parsing the same HTML twice."""
+        if page is None:
+            page = PageContent.parse(html)
         
         priority_links = []
         regular_links = []
@@ -722,7 +1228,9 @@ class EmailScraper:
         seen_urls = set()  # Track normalized URLs to avoid duplicates
         
         # Check if current page is a teacher page (URL pattern like /firstname-lastname or /lastname-firstname)
-        base_parsed = urlparse(base_url)
+        base_parsed = _parse_url(base_url)
+        # Every link is checked against base_url - split it only once
+        base_split = _scheme_and_base_domain(base_url)
         path_parts = [p for p in base_parsed.path.split('/') if p]
         is_teacher_page = (
             len(path_parts) >= 1 and 
@@ -731,22 +1239,28 @@ class EmailScraper:
         )
         
         # Also check for links in text content (some sites embed URLs in text)
-        text_content = soup.get_text()
+        text_content = page.get_text()
         # Find URLs in text that match our domain pattern
-        text_urls = re.findall(r'https?://[^\s<>"\']+\.dz[^\s<>"\']*', text_content, re.IGNORECASE)
-        
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            full_url = urljoin(base_url, href)
-            parsed_link = urlparse(full_url)
+        # (same matches as r'https?://[^\s<>"\']+\.dz[^\s<>"\']*', which is quadratic on long runs)
+        # (most pages have no URL written in their text - skip the scan when there is no '://')
+        text_urls = [u for u in self.text_url_pattern.findall(text_content)
+                     if '.dz' in u[u.index('://') + 4:].lower()] if '://' in text_content else []
+        
+        seen_hrefs = set()  # Menus repeat the same hrefs - join and parse each one only once
+        for href, link_text_parts in page.links:
+            if href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
+            full_url = join_url(base_url, href)
+            # Menus link the same URLs on every page - parsed results are memoized
+            parsed_link = _parse_url(full_url)
             
             # Skip non-HTTP(S) links
             if parsed_link.scheme not in ['http', 'https', '']:
                 continue
             
             # Skip login/admin pages early (they cause Playwright timeouts and have no emails)
-            href_lower = href.lower()
-            if any(skip in href_lower for skip in ['/user?', '/login', '/admin', 'admin_panel', '?login=', '&login=']):
+            if self.skip_href_pattern.search(href.lower()):
                 continue
             
             # Normalize URL
@@ -758,19 +1272,17 @@ class EmailScraper:
             seen_urls.add(normalized_url)
             
             # Check if it's the same base domain (including subdomains)
-            if self.is_same_base_domain(base_url, normalized_url):
+            if _base_domains_match(base_split, _scheme_and_base_domain(normalized_url)):
                 # Skip robots.txt check in find_links - it's done later when actually crawling
                 # This avoids hundreds of robots.txt requests for non-existent subdomains
                 # Check if this is a subdomain link (higher priority)
-                base_parsed = urlparse(base_url)
-                link_parsed = urlparse(normalized_url)
-                is_subdomain = (link_parsed.netloc != base_parsed.netloc and 
-                               self.is_same_base_domain(base_url, normalized_url))
+                # (parsed once per link; the same base domain was checked just above)
+                link_parsed = _parse_url(normalized_url)
+                is_subdomain = link_parsed.netloc != base_parsed.netloc
                 
                 # Check if link text or URL contains keywords
-                link_text = link.get_text(strip=True).lower()
+                link_text = ''.join(link_text_parts).lower()
                 url_lower = normalized_url.lower()
-                link_parsed = urlparse(normalized_url)
                 link_path_parts = [p for p in link_parsed.path.split('/') if p]
                 
                 # Check if this is a "Contact" link (CRITICAL for teacher pages)
@@ -782,36 +1294,27 @@ class EmailScraper:
                 
                 # Check if this is a teacher name link (URL pattern like /firstname-lastname)
                 # Teacher links typically have hyphenated names in the URL
+                # (a hyphen means at least 2 parts: firstname-lastname)
                 is_teacher_name_link = (
                     len(link_path_parts) >= 1 and
                     '-' in link_path_parts[-1] and  # Has hyphen (name pattern)
-                    not any(kw in url_lower for kw in ['websites', 'contact', 'page', 'admin', 'login']) and
-                    link_path_parts[-1].count('-') >= 1 and  # At least one hyphen
-                    len(link_path_parts[-1].split('-')) >= 2  # Has at least 2 parts (firstname-lastname)
+                    not self.non_teacher_url_pattern.search(url_lower)
                 )
                 
-                # Enhanced keywords for finding teacher emails
-                teacher_keywords = priority_keywords + [
-                    'enseignant', 'enseignants', 'professeur', 'professeurs',
-                    'teacher', 'teachers', 'faculty', 'staff', 'personnel',
-                    'annuaire', 'directory', 'contact', 'equipe', 'team'
-                ]
-                is_priority = any(keyword in link_text or keyword in url_lower 
-                                for keyword in teacher_keywords)
-                
-                # Check if this is a faculty/major/department link
-                is_faculty_link = any(keyword in link_text or keyword in url_lower 
-                                     for keyword in faculty_keywords)
+                # link_text and url_lower joined so each list is one scan ('\x00' is in no keyword).
+                # The faculty and priority keyword scans only run for links that reach those
+                # branches below - most links are classified before them
+                link_haystack = link_text + '\x00' + url_lower
                 
                 # Detect pagination links (especially for /websites pages)
                 # Check for pagination patterns: /websites?page=, ?page=, ?p=, numeric links, next/last links
+                # ('&page=', '?page=', '&p=', '?p=' contain 'page=' or 'p='; a numeric link
+                # text counts on /websites pages and everywhere else alike)
                 is_pagination = (
-                    ('websites' in url_lower and ('page=' in url_lower or '&page=' in url_lower)) or
-                    ('page=' in url_lower or '&page=' in url_lower or '?page=' in url_lower) or
-                    ('p=' in url_lower or '&p=' in url_lower or '?p=' in url_lower) or
-                    (link_text.isdigit() and link_text != '') or
-                    link_text.lower() in ['next', 'suivant', '»', 'last', 'dernier', 'precedent', 'previous', '«'] or
-                    ('websites' in base_url.lower() and link_text.isdigit())
+                    'page=' in url_lower or
+                    'p=' in url_lower or
+                    link_text.isdigit() or
+                    link_text in PAGINATION_LINK_TEXTS  # link_text is already lowercase
                 )
                 
                 # Priority order: Contact links (on teacher pages) > Pagination > Teacher name links > Faculty > Subdomains > Priority > Regular
@@ -829,11 +1332,12 @@ class EmailScraper:
                 elif is_teacher_name_link:
                     # Teacher name link - very high priority (leads to teacher page, then contact)
                     teacher_links.append(normalized_url)
-                elif is_faculty_link:
+                elif matches_link_faculty_keyword(link_haystack):
+                    # Faculty/major/department link
                     faculty_links.append(normalized_url)
                 elif is_subdomain:
                     subdomain_links.append(normalized_url)
-                elif is_priority:
+                elif matches_link_teacher_keyword(link_haystack):
                     priority_links.append(normalized_url)
                 else:
                     regular_links.append(normalized_url)
@@ -843,14 +1347,12 @@ class EmailScraper:
             try:
                 normalized_text_url = self.normalize_url(text_url)
                 if (normalized_text_url not in seen_urls and 
-                    self.is_same_base_domain(base_url, normalized_text_url)):
+                    _base_domains_match(base_split, _scheme_and_base_domain(normalized_text_url))):
                     seen_urls.add(normalized_text_url)
-                    base_parsed = urlparse(base_url)
-                    text_parsed = urlparse(normalized_text_url)
-                    is_subdomain = (text_parsed.netloc != base_parsed.netloc and 
-                                   self.is_same_base_domain(base_url, normalized_text_url))
+                    text_parsed = _parse_url(normalized_text_url)
+                    is_subdomain = text_parsed.netloc != base_parsed.netloc
                     url_lower = normalized_text_url.lower()
-                    is_priority = any(keyword in url_lower for keyword in priority_keywords)
+                    is_priority = matches_link_priority_keyword(url_lower)
                     
                     if is_subdomain:
                         subdomain_links.append(normalized_text_url)
@@ -871,25 +1373,23 @@ class EmailScraper:
         # 7. Regular links (everything else)
         return contact_links + priority_links + teacher_links + faculty_links + subdomain_links + regular_links
     
-    def _discover_subdomains_from_html(self, html: str, base_url: str) -> List[str]:
+    def _discover_subdomains_from_html(self, html: str, base_url: str, page: Optional[PageContent] = None) -> List[str]:
         """Discover subdomain URLs from HTML content (finds department subdomains like fmath.usthb.dz).
-        Only uses actual links, not text mentions, to avoid false positives."""
-        discovered = []
-        try:
-            soup = BeautifulSoup(html, self.html_parser)
-        except Exception:
-            soup = BeautifulSoup(html, 'html.parser')
+        Only uses actual links, not text mentions, to avoid false positives.
+        Pass an already parsed page to avoid parsing the same HTML twice."""
+        discovered = {}  # Ordered set of normalized URLs
+        if page is None:
+            page = PageContent.parse(html)
         
-        base_parsed = urlparse(base_url)
+        base_parsed = _parse_url(base_url)
         base_domain_no_www = self._strip_www(base_parsed.netloc)
         
         # Find all links that point to subdomains (only actual links, not text)
         # If a subdomain is in an actual link on the website, it likely exists - try it
         # No hardcoded patterns - only use what's actually linked on the website
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            full_url = urljoin(base_url, href)
-            parsed_link = urlparse(full_url)
+        for href, _ in page.links:
+            full_url = join_url(base_url, href)
+            parsed_link = _parse_url(full_url)
             
             if not parsed_link.netloc:
                 continue
@@ -901,13 +1401,13 @@ class EmailScraper:
                 # If it's linked on the website, it's likely valid - add it
                 # DNS errors will filter out non-existent ones quickly (connect=0 retries)
                 normalized = self.normalize_url(full_url)
-                if self.is_same_base_domain(base_url, normalized) and normalized not in discovered:
-                    discovered.append(normalized)
+                if normalized not in discovered and self.is_same_base_domain(base_url, normalized):
+                    discovered[normalized] = None
         
         # Don't search in text content - too many false positives
         # Only use actual links found in HTML
         
-        return discovered
+        return list(discovered)
     
     def discover_subdomain_pages(self, base_url: str) -> List[str]:
         """Discover subdomain pages that likely contain teacher emails.
@@ -945,30 +1445,31 @@ class EmailScraper:
         
         return list(discovered)
     
-    def _process_url(self, url: str, seed_url: str) -> Tuple[str, Optional[List[Dict]], Optional[str], List[str]]:
-        """Process a single URL and return emails, HTML, and new links (thread-safe)."""
+    def _process_url(self, url: str, seed_url: str) -> Tuple[str, Optional[List[Dict]], Optional[str], Optional[PageContent], List[str]]:
+        """Process a single URL and return emails, HTML, the parsed page and new links (thread-safe)."""
         # Skip login/admin pages early (before fetching) - they're not useful and cause Playwright timeouts
         url_lower = url.lower()
-        if any(skip in url_lower for skip in ['/user?', '/login', '/admin', 'admin_panel', '?login=', '&login=']):
+        if self.skip_href_pattern.search(url_lower):
             logger.debug(f"Skipping login/admin page: {url}")
-            return url, None, None, []
+            return url, None, None, None, []
         
         # Check if already visited (thread-safe)
+        visited_key = self._visited_key(url)
         with self.visited_lock:
-            if url in self.visited_urls:
-                return url, None, None, []
+            if visited_key in self.visited_urls:
+                return url, None, None, None, []
             # Mark as visited immediately to prevent duplicate processing
-            self.visited_urls.add(url)
+            self.visited_urls.add(visited_key)
         
         # Check robots.txt (outside lock to avoid blocking, but robots.txt is cached so it's fast)
-        if not self.can_fetch(url):
+        # Robots check and crawl delay from one cached robots.txt lookup
+        allowed, delay = self.robots_decision(url)
+        if not allowed:
             logger.debug(f"Skipping {url} (disallowed by robots.txt)")
-            return url, None, None, []
+            return url, None, None, None, []
         
-        # Get crawl delay
-        delay = self.get_crawl_delay(url)
         if delay > 0:
-            time.sleep(delay)
+            self._wait_for_host_slot(url, delay)
         
         # Fetch HTML
         response = self.fetch_html(url)
@@ -977,23 +1478,24 @@ class EmailScraper:
         
         if response is None:
             # If fetch_html failed (403, etc.), try Playwright directly for /websites pages
-            if 'websites' in url_lower and not any(skip in url_lower for skip in ['/user?', '/login', '/admin', 'admin_panel', '?login=', '&login=']):
+            if 'websites' in url_lower and not self.skip_href_pattern.search(url_lower):
                 logger.info(f"Regular fetch failed for {url}, trying Playwright")
                 try:
                     playwright_html = self.fetch_html_with_playwright(url)
                     if playwright_html:
                         html = playwright_html
-                        emails = self.extract_emails_from_html(html, url)
+                        page = PageContent.parse(html)
+                        emails = self.extract_emails_from_html(html, url, page=page)
                         logger.info(f"Playwright succeeded for {url}, found {len(emails)} emails")
                     else:
                         logger.warning(f"Playwright also failed for {url}")
-                        return url, None, None, []
+                        return url, None, None, None, []
                 except Exception as e:
                     logger.warning(f"Playwright failed for {url}: {e}")
-                    return url, None, None, []
+                    return url, None, None, None, []
             else:
                 logger.debug(f"Failed to fetch {url} - response is None")
-                return url, None, None, []
+                return url, None, None, None, []
         else:
             # Ensure proper encoding (handle .dz domain encoding issues)
             if response.encoding is None:
@@ -1010,40 +1512,49 @@ class EmailScraper:
                         continue
                 else:
                     logger.warning(f"Could not decode {url}, skipping")
-                    return url, None, None, []
+                    return url, None, None, None, []
             
-            # Extract emails from HTML
-            emails = self.extract_emails_from_html(html, url)
+            # Extract emails from HTML (parsed once, reused for link discovery).
+            # The page is always parsed here because link discovery needs it - the
+            # '@'/'.dz' prefilters only let email-free pages skip candidate extraction
+            page = PageContent.parse(html)
+            emails = self.extract_emails_from_html(html, url, page=page)
             
-            # For /websites pages, ALWAYS try Playwright - emails might be in JS-rendered content
-            # Also try Playwright if no emails found and page is small
+            # For /websites pages, try Playwright - emails might be in JS-rendered content -
+            # unless the static HTML already has both emails and links (it rendered server-side)
+            # Also try Playwright if no emails found and page is small - unless it has no
+            # <script> at all, since then rendering it can't produce anything new
             # BUT skip Playwright for login/admin pages (they cause timeouts and have no emails)
             should_try_playwright = (
-                'websites' in url_lower or  # ALL /websites pages - emails might be JS-rendered
-                (len(emails) == 0 and len(html) < 10000)
-            ) and not any(skip in url_lower for skip in ['/user?', '/login', '/admin', 'admin_panel', '?login=', '&login='])
+                ('websites' in url_lower and not (emails and page.links)) or
+                (len(emails) == 0 and len(html) < 10000 and bool(page.scripts))
+            ) and not self.skip_href_pattern.search(url_lower)
             
             if should_try_playwright:
                 try:
                     logger.debug(f"Trying Playwright for {url} (websites page or no emails found)")
                     playwright_html = self.fetch_html_with_playwright(url)
                     if playwright_html:
-                        emails = self.extract_emails_from_html(playwright_html, url)
+                        playwright_page = PageContent.parse(playwright_html)
+                        emails = self.extract_emails_from_html(playwright_html, url, page=playwright_page)
                         logger.debug(f"Playwright found {len(emails)} emails on {url}")
                         # Use Playwright HTML for link discovery too (it has the rendered content)
                         html = playwright_html
+                        page = playwright_page
                 except Exception as e:
                     logger.debug(f"Playwright failed for {url}: {e}")
         
         # Find links on page
-        new_links = self.find_links_on_page(html, url)
+        new_links = self.find_links_on_page(html, url, page=page)
         
-        return url, emails, html, new_links
+        return url, emails, html, page, new_links
     
-    def scrape_domain(self, seed_url: str) -> List[Dict]:
-        """Scrape a domain starting from seed URL, including subdomains (optimized with concurrency)."""
+    def scrape_domain(self, seed_url: str) -> Iterator[Dict]:
+        """Scrape a domain starting from seed URL, including subdomains (optimized with concurrency).
+        Emails are yielded as soon as their page is processed, so callers can write them out
+        without holding the whole domain in memory."""
         logger.info(f"Scraping domain: {seed_url}")
-        all_emails = []
+        emails_found = 0
         
         # Normalize seed URL
         normalized_seed = self.normalize_url(seed_url)
@@ -1053,6 +1564,8 @@ class EmailScraper:
         seed_parsed = urlparse(normalized_seed)
         seed_domain = seed_parsed.netloc
         seed_domain_no_www = self._strip_www(seed_domain)
+        # Frontier links are all checked against the seed - split it once per scrape
+        seed_split = _scheme_and_base_domain(normalized_seed)
         
         # Extract base domain (for .dz domains, base is last 2 parts, e.g., univ-batna2.dz)
         domain_parts = seed_domain_no_www.split('.')
@@ -1075,18 +1588,8 @@ class EmailScraper:
             common_subdomains = self.discover_subdomain_pages(normalized_seed)
             discovered_subdomains.extend(common_subdomains)
             logger.info(f"Trying {len(common_subdomains)} common department subdomains for teacher emails")
-            
-            # Then, fetch main page to discover additional subdomains from actual links
-            try:
-                main_page_response = self.fetch_html(normalized_seed)
-                if main_page_response:
-                    main_page_html = main_page_response.text
-                    # Find subdomain links in the main page (only actual links)
-                    discovered_from_main = self._discover_subdomains_from_html(main_page_html, normalized_seed)
-                    discovered_subdomains.extend(discovered_from_main)
-                    logger.info(f"Discovered {len(discovered_from_main)} additional subdomains from main page links")
-            except Exception as e:
-                logger.debug(f"Could not fetch main page for subdomain discovery: {e}")
+            # Additional subdomains are discovered from the main page links once the crawl
+            # has fetched it (below), instead of fetching the main page twice up front
         else:
             logger.info(f"Seed URL is already a subdomain ({seed_domain}), skipping subdomain discovery - going directly to page")
         
@@ -1097,7 +1600,8 @@ class EmailScraper:
         
         # Initialize queue with seed (and discovered subdomains if any)
         queue = deque([normalized_seed] + discovered_subdomains)
-        seen_in_queue = {normalized_seed} | set(discovered_subdomains)
+        # Hashed like visited_urls, so one key per link serves both lookups
+        seen_in_queue = {self._visited_key(u) for u in [normalized_seed] + discovered_subdomains}
         
         pages_scraped = 0
         max_queue_size = MAX_PAGES_PER_DOMAIN * 5  # Increased queue size for large sites (55 pages × teachers × contact pages)
@@ -1106,29 +1610,34 @@ class EmailScraper:
         # DNS failures don't count as consecutive failures (they're expected for non-existent subdomains)
         
         # Use ThreadPoolExecutor for concurrent processing
+        # Keep up to max_workers URLs in flight and refill as soon as any one finishes,
+        # so a single slow page never holds back the rest of the workers
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            while queue and pages_scraped < MAX_PAGES_PER_DOMAIN:
+            future_to_url = {}
+            while (queue or future_to_url) and pages_scraped < MAX_PAGES_PER_DOMAIN:
                 # Safety check
                 if len(queue) > max_queue_size:
                     logger.warning(f"Queue size exceeded {max_queue_size}, stopping crawl for {seed_url}")
                     break
                 
-                # Process batch of URLs concurrently
-                batch_size = min(self.max_workers, len(queue), MAX_PAGES_PER_DOMAIN - pages_scraped)
-                if batch_size == 0:
+                # Top up in-flight URLs
+                max_in_flight = min(self.max_workers, MAX_PAGES_PER_DOMAIN - pages_scraped)
+                while queue and len(future_to_url) < max_in_flight:
+                    url = queue.popleft()
+                    future_to_url[executor.submit(self._process_url, url, normalized_seed)] = url
+                
+                if not future_to_url:
                     break
                 
-                batch_urls = [queue.popleft() for _ in range(batch_size)]
-                future_to_url = {executor.submit(self._process_url, url, normalized_seed): url 
-                                for url in batch_urls}
+                done, _ = wait(future_to_url, return_when=FIRST_COMPLETED)
                 
                 batch_emails = []
                 batch_new_links = []
                 
-                for future in as_completed(future_to_url):
-                    url = future_to_url[future]
+                for future in done:
+                    url = future_to_url.pop(future)
                     try:
-                        processed_url, emails, html, new_links = future.result()
+                        processed_url, emails, html, page, new_links = future.result()
                         
                         # If we got HTML or emails, it's a successful fetch
                         if html is not None:
@@ -1141,6 +1650,17 @@ class EmailScraper:
                             
                             if new_links:
                                 batch_new_links.extend(new_links)
+                            
+                            # Find subdomain links in the main page (only actual links)
+                            if processed_url == normalized_seed and not is_already_subdomain:
+                                # (reuses the page _process_url already parsed)
+                                discovered_from_main = self._discover_subdomains_from_html(html, normalized_seed, page=page)
+                                logger.info(f"Discovered {len(discovered_from_main)} additional subdomains from main page links")
+                                for subdomain_url in discovered_from_main:
+                                    subdomain_key = self._visited_key(subdomain_url)
+                                    if subdomain_key not in seen_in_queue:
+                                        seen_in_queue.add(subdomain_key)
+                                        queue.append(subdomain_url)
                         else:
                             # Failed to fetch (None returned)
                             # Only increment if we have links in queue (means we're still trying)
@@ -1156,7 +1676,8 @@ class EmailScraper:
                         consecutive_failures += 1
                 
                 # Add emails found in this batch
-                all_emails.extend(batch_emails)
+                emails_found += len(batch_emails)
+                yield from batch_emails
                 
                 # Add new links to queue (prioritize pagination, contact, and teacher name links)
                 contact_links = []
@@ -1166,38 +1687,20 @@ class EmailScraper:
                 priority_links = []
                 regular_links = []
                 
-                # Keywords for faculties/majors/departments
-                faculty_keywords = [
-                    'faculte', 'faculty', 'facultes', 'faculties',
-                    'departement', 'department', 'departements', 'departments',
-                    'filiere', 'specialite', 'formation', 'domaine',
-                    'section', 'option', 'mathematiques', 'informatique',
-                    'physique', 'chimie', 'biologie', 'electronique',
-                    'mecanique', 'genie', 'economie', 'droit',
-                    'lettres', 'philosophie', 'sociologie', 'psychologie',
-                    'medecine', 'pharmacie', 'sciences', 'islamiques', 'fsi'
-                ]
-                
-                for link in batch_new_links:
-                    normalized_link = self.normalize_url(link)
-                    if normalized_link in seen_in_queue:
+                # find_links_on_page returns normalized URLs - no need to normalize them again
+                for normalized_link in batch_new_links:
+                    link_key = self._visited_key(normalized_link)
+                    # A set lookup is atomic under the GIL - no need to take visited_lock
+                    # per link just to read (workers still add under the lock)
+                    if link_key in seen_in_queue or link_key in self.visited_urls:
                         continue
                     
-                    with self.visited_lock:
-                        if normalized_link in self.visited_urls:
-                            continue
-                    
                     # Check if it's a subdomain
-                    base_parsed = urlparse(normalized_seed)
-                    link_parsed = urlparse(normalized_link)
-                    is_subdomain = (link_parsed.netloc != base_parsed.netloc and 
-                                   self.is_same_base_domain(normalized_seed, normalized_link))
+                    link_parsed = _parse_url(normalized_link)
+                    is_subdomain = (link_parsed.netloc != seed_domain and 
+                                   _base_domains_match(seed_split, _scheme_and_base_domain(normalized_link)))
                     
-                    # Check for priority keywords
-                    priority_keywords = ['staff', 'websites', 'contact', 'personnel', 'enseignants',
-                                       'professeurs', 'annuaire', 'directory']
                     url_lower = normalized_link.lower()
-                    is_priority = any(kw in url_lower for kw in priority_keywords)
                     
                     # Check if it's a contact link (HIGHEST PRIORITY - leads directly to email)
                     is_contact = 'contact' in url_lower or link_parsed.path.endswith('/contact')
@@ -1207,21 +1710,14 @@ class EmailScraper:
                     is_teacher_name = (
                         len(link_path_parts) >= 1 and
                         '-' in link_path_parts[-1] and
-                        not any(kw in url_lower for kw in ['websites', 'contact', 'page', 'admin', 'login']) and
-                        link_path_parts[-1].count('-') >= 1 and
-                        len(link_path_parts[-1].split('-')) >= 2
+                        not self.non_teacher_url_pattern.search(url_lower)
                     )
                     
                     # Check if it's a pagination link (CRITICAL - need all pages)
-                    is_pagination = (
-                        ('websites' in url_lower and ('page=' in url_lower or '&page=' in url_lower)) or
-                        ('page=' in url_lower or '&page=' in url_lower or '?page=' in url_lower) or
-                        ('p=' in url_lower or '&p=' in url_lower or '?p=' in url_lower)
-                    )
-                    
-                    # Check if it's a faculty/major/department link
-                    is_faculty = any(kw in url_lower for kw in faculty_keywords)
+                    is_pagination = 'page=' in url_lower or 'p=' in url_lower
                     
+                    # Faculty and priority keywords are only scanned for links not
+                    # already classified by a cheaper check above them
                     if is_contact:
                         contact_links.append(normalized_link)
                     elif is_pagination:
@@ -1229,75 +1725,148 @@ class EmailScraper:
                         priority_links.insert(0, normalized_link)  # Insert at front
                     elif is_teacher_name:
                         teacher_links.append(normalized_link)
-                    elif is_faculty:
+                    elif matches_frontier_faculty_keyword(url_lower):
+                        # Faculty/major/department link
                         faculty_links.append(normalized_link)
                     elif is_subdomain:
                         subdomain_links.append(normalized_link)
-                    elif is_priority:
+                    elif matches_frontier_priority_keyword(url_lower):
                         priority_links.append(normalized_link)
                     else:
                         regular_links.append(normalized_link)
                     
-                    seen_in_queue.add(normalized_link)
+                    seen_in_queue.add(link_key)
                 
                 # Add links to queue in priority order (contact > pagination > teacher > faculty > subdomain > priority > regular)
-                # Increased limit to 500 to handle large sites with many pages (55 pages × teachers)
-                for link in (contact_links + priority_links + teacher_links + faculty_links + subdomain_links + regular_links)[:500]:
+                # Increased limit to 500 to handle large sites with many pages (55 pages × teachers).
+                # The limit is per max_workers pages - scaled to the pages completed here
+                max_new_links = max(1, 500 * len(done) // self.max_workers)
+                for link in (contact_links + priority_links + teacher_links + faculty_links + subdomain_links + regular_links)[:max_new_links]:
                     queue.append(link)
                 
                 # Stop if too many consecutive failures
                 if consecutive_failures >= max_consecutive_failures:
                     logger.warning(f"Too many consecutive failures ({consecutive_failures}), stopping crawl for {seed_url}")
                     break
-        
-        logger.info(f"Scraped {pages_scraped} pages from {seed_url}, found {len(all_emails)} email occurrences")
-        return all_emails
+            
+            # Stopped early - pages still being fetched are finished anyway (the executor
+            # waits for them), so keep their emails instead of dropping them
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                try:
+                    _, emails, html, _, _ = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing {url}: {e}")
+                    continue
+                if html is not None:
+                    pages_scraped += 1
+                    if emails:
+                        emails_found += len(emails)
+                        yield from emails
+        
+        logger.info(f"Scraped {pages_scraped} pages from {seed_url}, found {emails_found} email occurrences")
     
     def save_raw_emails(self, emails: List[Dict]):
-        """Save raw emails to CSV."""
+        """Save raw emails to CSV (queued - written by the writer thread)."""
         if not emails:
             return
-        
-        file_exists = OUTPUT_RAW.exists()
-        
+        self._raw_queue.put(emails)
+    
+    def _raw_writer_loop(self):
+        """Append queued batches to OUTPUT_RAW until close() queues None."""
+        while True:
+            emails = self._raw_queue.get()
+            if emails is None:
+                return
+            self._write_raw_emails(emails)
+    
+    def _write_raw_emails(self, emails: List[Dict]):
+        """Append one batch of raw emails to OUTPUT_RAW."""
         try:
-            with open(OUTPUT_RAW, 'a', newline='', encoding='utf-8') as f:
-                fieldnames = ['email', 'local_part', 'domain', 'source_url', 'source_type',
-                             'page_title', 'context_snippet', 'http_status', 'found_at',
-                             'parse_method', 'notes']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
+            gzipped = OUTPUT_RAW.suffix == '.gz'
+            if self._raw_writer is None:
+                ensure_dir(DATA_DIR)
+                self._repair_raw_output()
+                write_header = not OUTPUT_RAW.exists() or OUTPUT_RAW.stat().st_size == 0
+                # Plain CSV: one handle for the whole run with a 64 KB buffer, instead of
+                # reopening the file (and rebuilding the writer) for every batch
+                self._raw_file = self._open_raw_output('a')
+                # Records are built with RAW_FIELDNAMES keys only, so skip DictWriter's
+                # per-row check for extra keys
+                self._raw_writer = csv.DictWriter(self._raw_file, fieldnames=RAW_FIELDNAMES, extrasaction='ignore')
                 
-                if not file_exists:
-                    writer.writeheader()
-                
-                for email_data in emails:
-                    # Ensure all required fields exist
-                    email_data.setdefault('http_status', '200')
-                    # Sanitize string fields to prevent CSV injection
-                    for key in ['page_title', 'context_snippet', 'notes']:
-                        if key in email_data and email_data[key]:
-                            # Remove potential CSV injection characters
-                            val = str(email_data[key])
-                            if val.startswith(('=', '+', '-', '@')):
-                                email_data[key] = "'" + val
-                    writer.writerow(email_data)
+                if write_header:
+                    self._raw_writer.writeheader()
+            
+            for email_data in emails:
+                # Ensure all required fields exist
+                email_data.setdefault('http_status', '200')
+                # Sanitize string fields to prevent CSV injection
+                for key in CSV_SANITIZED_FIELDS:
+                    val = email_data.get(key)
+                    if val:
+                        # Remove potential CSV injection characters
+                        val = str(val)
+                        if val.startswith(CSV_INJECTION_PREFIXES):
+                            email_data[key] = "'" + val
+            # One C-level loop over the batch instead of a writerow call per record
+            self._raw_writer.writerows(emails)
+            if gzipped:
+                # Close the gzip member (writing its trailer) after every batch, so each
+                # saved batch is a complete member; a kill mid-run loses at most the
+                # batch being written. The next batch starts a new member
+                self._raw_file.close()
+                self._raw_file = None
+                self._raw_writer = None
+            else:
+                # Each saved batch is on disk even if the run is interrupted later
+                self._raw_file.flush()
             
             logger.info(f"Saved {len(emails)} raw email records to {OUTPUT_RAW}")
         except (IOError, OSError) as e:
             logger.error(f"Failed to save emails to {OUTPUT_RAW}: {e}")
             # Don't raise - continue scraping even if save fails
     
+    def _repair_raw_output(self):
+        """Drop a truncated gzip member left at the end of OUTPUT_RAW by an earlier killed run.
+        
+        Checked once per run, before OUTPUT_RAW is first appended to or read.
+        """
+        if self._raw_output_checked:
+            return
+        self._raw_output_checked = True
+        if OUTPUT_RAW.suffix == '.gz' and OUTPUT_RAW.exists():
+            if truncate_incomplete_gzip_member(OUTPUT_RAW):
+                logger.warning(f"Dropped an incomplete gzip member at the end of {OUTPUT_RAW}")
+    
+    def _open_raw_output(self, mode: str):
+        """Open OUTPUT_RAW as text for reading ('r') or appending ('a'), through gzip if it ends in .gz."""
+        if OUTPUT_RAW.suffix == '.gz':
+            # Level 1: most of the size reduction for a fraction of the CPU. Appending
+            # adds a gzip member, which gzip readers decode as one stream
+            return gzip.open(OUTPUT_RAW, mode + 't', compresslevel=1, encoding='utf-8',
+                             newline='' if mode == 'a' else None)
+        if mode == 'a':
+            return open(OUTPUT_RAW, 'a', newline='', encoding='utf-8', buffering=64 * 1024)
+        return open(OUTPUT_RAW, mode, encoding='utf-8')
+    
     def clean_and_dedupe_emails(self):
         """Clean and deduplicate emails from raw CSV, removing administrative/institutional emails."""
         if not OUTPUT_RAW.exists():
             logger.warning("No raw emails file found")
             return
         
-        emails_dict: Dict[str, Dict] = {}
+        # Per unique email: [domain, first_seen, sources]. Sources are dict keys (an
+        # insertion-ordered set), so merging one is a hash lookup instead of re-splitting
+        # the joined string on every occurrence
+        emails_dict: Dict[str, list] = {}
+        # Emails already found institutional - the same address repeats on many rows
+        excluded_emails: Set[str] = set()
         excluded_count = 0
         
         try:
-            with open(OUTPUT_RAW, 'r', encoding='utf-8') as f:
+            self._repair_raw_output()
+            with self._open_raw_output('r') as f:
                 reader = csv.DictReader(f)
                 if not reader.fieldnames:
                     logger.error("Raw CSV file is empty or has no headers")
@@ -1312,37 +1881,33 @@ class EmailScraper:
                     if not email or '@' not in email:
                         continue
                     
-                    # Filter out administrative/institutional emails (keep only teacher emails)
-                    if self.is_institutional_email(email):
-                        excluded_count += 1
-                        continue
-                    
-                    if email not in emails_dict:
-                        # Extract domain from email (we already validated @ exists on line 622)
+                    entry = emails_dict.get(email)
+                    if entry is None:
+                        # Filter out administrative/institutional emails (keep only teacher emails)
+                        if email in excluded_emails or self.is_institutional_email(email):
+                            excluded_emails.add(email)
+                            excluded_count += 1
+                            continue
+                        
+                        # Extract domain from email (we already validated @ exists above)
                         domain = row.get('domain', '')
                         if not domain:
                             domain = email.split('@')[1]
-                        emails_dict[email] = {
-                            'email': email,
-                            'domain': domain.lower(),
-                            'first_seen': row.get('found_at', datetime.utcnow().isoformat()),
-                            'sources': row.get('source_url', ''),
-                            'verified': 'false',
-                            'status': 'unknown',
-                            'notes': ''
-                        }
+                        emails_dict[email] = [
+                            domain.lower(),
+                            row.get('found_at', datetime.utcnow().isoformat()),
+                            {row.get('source_url', ''): None},
+                        ]
                     else:
                         # Merge sources
                         new_source = row.get('source_url', '')
                         if new_source:
-                            existing_sources = emails_dict[email]['sources'].split(';')
-                            if new_source not in existing_sources:
-                                emails_dict[email]['sources'] += ';' + new_source
+                            entry[2][new_source] = None
                         
                         # Update first_seen if earlier
                         found_at = row.get('found_at', '')
-                        if found_at and found_at < emails_dict[email]['first_seen']:
-                            emails_dict[email]['first_seen'] = found_at
+                        if found_at and found_at < entry[1]:
+                            entry[1] = found_at
         except Exception as e:
             logger.error(f"Error reading raw CSV: {e}")
             return
@@ -1352,7 +1917,18 @@ class EmailScraper:
             fieldnames = ['email', 'domain', 'first_seen', 'sources', 'verified', 'status', 'notes']
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
-            writer.writerows(emails_dict.values())
+            writer.writerows(
+                {
+                    'email': email,
+                    'domain': domain,
+                    'first_seen': first_seen,
+                    'sources': ';'.join(sources),
+                    'verified': 'false',
+                    'status': 'unknown',
+                    'notes': ''
+                }
+                for email, (domain, first_seen, sources) in emails_dict.items()
+            )
         
         logger.info(f"Created clean CSV with {len(emails_dict)} unique teacher emails at {OUTPUT_CLEAN}")
         if excluded_count > 0:
@@ -1367,22 +1943,67 @@ class EmailScraper:
             logger.error("No seed URLs found. Please add URLs to seeds.txt")
             return
         
-        all_emails = []
+        emails_found = 0
         
-        for seed in tqdm(seeds, desc="Scraping domains"):
-            try:
-                emails = self.scrape_domain(seed)
-                all_emails.extend(emails)
-                self.save_raw_emails(emails)  # Save incrementally
-            except Exception as e:
-                logger.error(f"Error scraping {seed}: {e}")
-                continue
+        try:
+            # Fetch every seed's robots.txt up front, in parallel, instead of one by one
+            # when each domain's first page is crawled
+            self.prefetch_robots(seeds)
+            
+            # Domains are independent and the crawl is network-bound, so several seeds
+            # are crawled at once (the writer thread serializes their CSV output)
+            with ThreadPoolExecutor(max_workers=DOMAIN_WORKERS) as executor:
+                futures = [executor.submit(self._scrape_seed, seed) for seed in seeds]
+                # Progress goes to the log (a progress bar would be torn up by the
+                # log lines the crawling threads print to the same console)
+                for done, future in enumerate(as_completed(futures), 1):
+                    emails_found += future.result()
+                    logger.info(f"Finished {done}/{len(seeds)} domains")
+        finally:
+            self.close()
         
         # Clean and deduplicate
         logger.info("Cleaning and deduplicating emails...")
         self.clean_and_dedupe_emails()
         
-        logger.info(f"Scraping complete! Found {len(all_emails)} email occurrences")
+        logger.info(f"Scraping complete! Found {emails_found} email occurrences")
+    
+    def _scrape_seed(self, seed: str) -> int:
+        """Crawl one seed domain, saving its emails in batches. Returns the number saved."""
+        emails_found = 0
+        batch = []
+        try:
+            for email_data in self.scrape_domain(seed):
+                batch.append(email_data)
+                if len(batch) >= RAW_WRITE_BATCH_SIZE:
+                    self.save_raw_emails(batch)  # Save incrementally
+                    emails_found += len(batch)
+                    batch = []
+        except Exception as e:
+            logger.error(f"Error scraping {seed}: {e}")
+        # Write the rest of this domain (including what was found before an error)
+        self.save_raw_emails(batch)
+        return emails_found + len(batch)
+    
+    def close(self):
+        """Shut down the pooled Playwright browsers and the disk cache, close OUTPUT_RAW
+        and put socket.getaddrinfo back."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self.playwright_pool.close()
+        self.dns_cache.uninstall()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
+        # Let the writer thread finish the queued batches before closing the file
+        if self._raw_writer_thread.is_alive():
+            self._raw_queue.put(None)
+            self._raw_writer_thread.join()
+        if self._raw_file is not None:
+            self._raw_file.close()
+            self._raw_file = None
+            self._raw_writer = None
 
 
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+"""Tests for clean_emails.clean_csv."""
+import contextlib
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+scraper_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scraper_dir / "scripts"))
+sys.path.insert(0, str(scraper_dir))
+import clean_emails
+
+HEADER = 'email,domain,source_urls\r\n'
+
+
+class CleanCsvTest(unittest.TestCase):
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        self.clean = self.dir / 'emails_clean.csv'
+        self.removed_log = self.dir / 'logs' / 'removed_emails.log'
+        for name, value in (('OUTPUT_CLEAN', self.clean),
+                            ('LOGS_DIR', self.removed_log.parent),
+                            ('REMOVED_LOG', self.removed_log)):
+            patcher = mock.patch.object(clean_emails, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def read_clean(self) -> str:
+        with open(self.clean, encoding='utf-8', newline='') as f:
+            return f.read()
+    
+    def run_clean(self) -> str:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            clean_emails.clean_csv()
+        return out.getvalue()
+    
+    def test_replays_kept_prefix(self):
+        # Rows before the first removed one are copied from the file, the rest streamed;
+        # a quoted field with a newline checks the replay splits rows like csv does
+        self.clean.write_text(
+            HEADER +
+            'karim.haddad@univ-batna2.dz,univ-batna2.dz,"https://a.dz/1\nhttps://a.dz/2"\r\n'
+            'amina.saidi@univ-batna2.dz,univ-batna2.dz,https://a.dz/3\r\n'
+            'contact@univ-batna2.dz,univ-batna2.dz,https://a.dz/4\r\n'
+            'omar.zerrouki@usthb.dz,usthb.dz,https://usthb.dz/5\r\n'
+            'webmaster@usthb.dz,usthb.dz,https://usthb.dz/6\r\n',
+            encoding='utf-8', newline='')
+        
+        output = self.run_clean()
+        
+        self.assertEqual(self.read_clean(),
+                         HEADER +
+                         'karim.haddad@univ-batna2.dz,univ-batna2.dz,"https://a.dz/1\nhttps://a.dz/2"\r\n'
+                         'amina.saidi@univ-batna2.dz,univ-batna2.dz,https://a.dz/3\r\n'
+                         'omar.zerrouki@usthb.dz,usthb.dz,https://usthb.dz/5\r\n')
+        self.assertEqual(self.removed_log.read_text(encoding='utf-8'),
+                         'contact@univ-batna2.dz\nwebmaster@usthb.dz\n')
+        self.assertIn('Removed: 2', output)
+        self.assertIn('Remaining: 3', output)
+        self.assertFalse(self.clean.with_suffix('.tmp').exists())
+    
+    def test_first_row_removed(self):
+        self.clean.write_text(
+            HEADER +
+            'noreply@usthb.dz,usthb.dz,https://usthb.dz/1\r\n'
+            'omar.zerrouki@usthb.dz,usthb.dz,https://usthb.dz/2\r\n',
+            encoding='utf-8', newline='')
+        
+        self.run_clean()
+        
+        self.assertEqual(self.read_clean(),
+                         HEADER + 'omar.zerrouki@usthb.dz,usthb.dz,https://usthb.dz/2\r\n')
+    
+    def test_nothing_to_clean_leaves_file_untouched(self):
+        content = (HEADER +
+                   'karim.haddad@univ-batna2.dz,univ-batna2.dz,https://a.dz/1\n'
+                   'omar.zerrouki@usthb.dz,usthb.dz,https://usthb.dz/2\n')
+        self.clean.write_text(content, encoding='utf-8', newline='')
+        
+        output = self.run_clean()
+        
+        self.assertIn('Nothing to clean - 2 person emails', output)
+        self.assertEqual(self.read_clean(), content)
+        self.assertFalse(self.clean.with_suffix('.tmp').exists())
+        self.assertFalse(self.removed_log.exists())
+    
+    def test_missing_file(self):
+        self.assertIn('File not found', self.run_clean())
+
+
+if __name__ == '__main__':
+    unittest.main()
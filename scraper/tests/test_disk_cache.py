@@ -0,0 +1,50 @@
+"""Tests for disk_cache.DiskCache."""
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+scraper_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scraper_dir))
+import disk_cache
+from disk_cache import DiskCache
+
+
+class DiskCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = DiskCache(Path(tmp.name) / 'http_cache.sqlite3')
+        self.addCleanup(self.cache.close)
+    
+    def test_round_trip(self):
+        self.cache.put('https://usthb.dz/', b'<p>page</p>', etag='"abc"',
+                       last_modified='Mon, 01 Jan 2024 00:00:00 GMT', encoding='utf-8')
+        cached = self.cache.get('https://usthb.dz/')
+        self.assertEqual(cached.body, b'<p>page</p>')
+        self.assertEqual(cached.etag, '"abc"')
+        self.assertEqual(cached.last_modified, 'Mon, 01 Jan 2024 00:00:00 GMT')
+        self.assertEqual(cached.encoding, 'utf-8')
+    
+    def test_missing(self):
+        self.assertIsNone(self.cache.get('https://usthb.dz/missing'))
+    
+    def test_expired_entry_is_not_decompressed(self):
+        self.cache.put('https://usthb.dz/', b'<p>page</p>')
+        with mock.patch.object(disk_cache.time, 'time', return_value=disk_cache.time.time() + 3600), \
+                mock.patch.object(disk_cache.zlib, 'decompress') as decompress:
+            self.assertIsNone(self.cache.get('https://usthb.dz/', max_age=60))
+        decompress.assert_not_called()
+    
+    def test_touch_refreshes_age(self):
+        self.cache.put('https://usthb.dz/', b'<p>page</p>')
+        later = disk_cache.time.time() + 3600
+        with mock.patch.object(disk_cache.time, 'time', return_value=later):
+            self.cache.touch('https://usthb.dz/')
+            self.assertIsNotNone(self.cache.get('https://usthb.dz/', max_age=60))
+
+
+if __name__ == '__main__':
+    unittest.main()
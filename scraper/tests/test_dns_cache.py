@@ -0,0 +1,91 @@
+"""Tests for dns_cache.DnsCache."""
+import socket
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+scraper_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scraper_dir))
+import dns_cache
+from dns_cache import DnsCache
+
+
+class DnsCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.calls = []
+        self.now = 1000.0
+        for target, name, value in ((dns_cache, '_original_getaddrinfo', self.fake_getaddrinfo),
+                                    (dns_cache.time, 'monotonic', lambda: self.now)):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.cache = DnsCache(ttl=300, negative_ttl=120, max_size=3)
+    
+    def fake_getaddrinfo(self, host, port, *args, **kwargs):
+        self.calls.append(host)
+        if host == 'missing.usthb.dz':
+            raise socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        if host == 'flaky.usthb.dz':
+            raise socket.gaierror(socket.EAI_AGAIN, 'Temporary failure in name resolution')
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', port))]
+    
+    def test_hit(self):
+        first = self.cache.getaddrinfo('usthb.dz', 443)
+        self.assertEqual(self.cache.getaddrinfo('usthb.dz', 443), first)
+        self.assertEqual(self.calls, ['usthb.dz'])
+    
+    def test_expiry(self):
+        self.cache.getaddrinfo('usthb.dz', 443)
+        self.now += 301
+        self.cache.getaddrinfo('usthb.dz', 443)
+        self.assertEqual(self.calls, ['usthb.dz', 'usthb.dz'])
+    
+    def test_negative_caching(self):
+        for _ in range(2):
+            with self.assertRaises(socket.gaierror) as raised:
+                self.cache.getaddrinfo('missing.usthb.dz', 443)
+            self.assertEqual(raised.exception.errno, socket.EAI_NONAME)
+        self.assertEqual(self.calls, ['missing.usthb.dz'])
+        
+        self.now += 121
+        with self.assertRaises(socket.gaierror):
+            self.cache.getaddrinfo('missing.usthb.dz', 443)
+        self.assertEqual(self.calls, ['missing.usthb.dz', 'missing.usthb.dz'])
+    
+    def test_temporary_failure_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(socket.gaierror):
+                self.cache.getaddrinfo('flaky.usthb.dz', 443)
+        self.assertEqual(self.calls, ['flaky.usthb.dz', 'flaky.usthb.dz'])
+    
+    def test_least_recently_used_evicted(self):
+        for host in ('a.dz', 'b.dz', 'c.dz'):
+            self.cache.getaddrinfo(host, 443)
+        self.cache.getaddrinfo('a.dz', 443)  # a.dz is now the most recently used
+        self.cache.getaddrinfo('d.dz', 443)  # evicts b.dz
+        self.cache.getaddrinfo('a.dz', 443)
+        self.cache.getaddrinfo('b.dz', 443)
+        self.assertEqual(self.calls, ['a.dz', 'b.dz', 'c.dz', 'd.dz', 'b.dz'])
+    
+    def test_install_and_uninstall(self):
+        original = socket.getaddrinfo
+        self.addCleanup(setattr, socket, 'getaddrinfo', original)
+        self.cache.install()
+        self.assertEqual(socket.getaddrinfo, self.cache.getaddrinfo)
+        self.cache.uninstall()
+        self.assertIs(socket.getaddrinfo, dns_cache._original_getaddrinfo)
+    
+    def test_uninstall_leaves_other_cache_installed(self):
+        original = socket.getaddrinfo
+        self.addCleanup(setattr, socket, 'getaddrinfo', original)
+        other = DnsCache(ttl=300, negative_ttl=120)
+        self.cache.install()
+        other.install()
+        self.cache.uninstall()
+        self.assertEqual(socket.getaddrinfo, other.getaddrinfo)
+
+
+if __name__ == '__main__':
+    unittest.main()
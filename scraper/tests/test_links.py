@@ -0,0 +1,86 @@
+"""Tests for link resolution and find_links_on_page ordering."""
+import logging
+import sys
+import unittest
+from pathlib import Path
+from urllib.parse import urljoin
+
+scraper_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scraper_dir / "scripts"))
+sys.path.insert(0, str(scraper_dir))
+from scraper import EmailScraper, join_url
+
+BASES = [
+    'https://staff.univ-batna2.dz/websites',
+    'https://staff.univ-batna2.dz/a/b/c?x=1#f',
+    'http://www.univ-batna2.dz/',
+    'https://usthb.dz',
+    'https://u:p@usthb.dz:8443/fr/page;par?q',
+]
+HREFS = [
+    '', '/', '//', '//?q', '///x', '/a/../b', '/x?', '/#f', ' /x', '/\tx',
+    'http://', 'https://?q', 'http:///x', 'https://x.dz/a/./b?', 'https://x.dz#',
+    'http://u:p@h:80/x', 'HTTP://A/B', 'https://X.DZ/A/../B', 'http://x.dz',
+    'javascript:void(0)', 'mailto:a@b.dz', '?p=2', '#top', 'a/b', '../c', './d',
+]
+
+
+class JoinUrlTest(unittest.TestCase):
+    
+    def test_same_as_urljoin(self):
+        for base in BASES:
+            for href in HREFS:
+                with self.subTest(base=base, href=href):
+                    self.assertEqual(join_url(base, href), urljoin(base, href))
+    
+    def test_root_relative_shared_across_pages(self):
+        # Resolved against the host root, whatever page of the host links it
+        self.assertEqual(join_url('https://usthb.dz/a/b', '/staff'), 'https://usthb.dz/staff')
+        self.assertEqual(join_url('https://usthb.dz/c', '/staff'), 'https://usthb.dz/staff')
+        self.assertEqual(join_url('https://usthb.dz/a/b', 'staff'), 'https://usthb.dz/a/staff')
+
+
+class FindLinksOrderTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        cls.scraper = EmailScraper()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.scraper.close()
+        logging.disable(logging.NOTSET)
+    
+    def test_priority_order(self):
+        html = '''
+            <a href="/news">News</a>
+            <a href="/annuaire">Annuaire</a>
+            <a href="https://portail.usthb.dz/">Portail</a>
+            <a href="https://fmath.usthb.dz/accueil">Maths</a>
+            <a href="/departement">Departement</a>
+            <a href="/karim-haddad">Karim Haddad</a>
+            <a href="/list?page=2">2</a>
+            <a href="/list?page=3">3</a>
+            <a href="/contact">Nous contacter</a>
+            <a href="/login">Login</a>
+            <a href="https://other.dz/x">Other site</a>
+            <a href="/news">News again</a>
+            <p>See https://usthb.dz/staff/list for more</p>
+        '''
+        self.assertEqual(self.scraper.find_links_on_page(html, 'https://usthb.dz/fr/home'), [
+            'https://usthb.dz/contact',  # contact
+            'https://usthb.dz/list?page=3',  # pagination, latest first
+            'https://usthb.dz/list?page=2',
+            'https://usthb.dz/annuaire',  # priority keyword
+            'https://usthb.dz/staff/list',  # priority keyword, written in the page text
+            'https://usthb.dz/karim-haddad',  # teacher name
+            'https://fmath.usthb.dz/accueil',  # faculty keyword
+            'https://usthb.dz/departement',
+            'https://portail.usthb.dz/',  # subdomain
+            'https://usthb.dz/news',  # regular
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
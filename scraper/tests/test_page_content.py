@@ -0,0 +1,98 @@
+"""Tests for PageContent (the lxml parser target) and email extraction from it."""
+import logging
+import sys
+import unittest
+from pathlib import Path
+
+scraper_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scraper_dir / "scripts"))
+sys.path.insert(0, str(scraper_dir))
+import scraper
+from scraper import EmailScraper, PageContent
+
+PAGE = '''<html><head><title> Departement </title>
+<meta name="description" content="Contact karim.haddad@univ-batna2.dz">
+<meta charset="utf-8">
+</head><body>
+<a href="/staff">Staff <b>list</b></a>
+<a href="mailto:amina.saidi@univ-batna2.dz?subject=x">Mail</a>
+<a name="top">no href</a>
+<span data-email="yacine.ferhat@usthb.dz">Yacine</span>
+<script>var e = "nadia.khelifi@usthb.dz";</script>
+<script></script>
+<style>.hidden { display: none }</style>
+<p>Text omar.zerrouki@univ-batna2.dz here</p>
+</body></html>'''
+
+
+class PageContentTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.page = PageContent.parse(PAGE)
+    
+    def test_title(self):
+        self.assertEqual(self.page.title, ' Departement ')
+    
+    def test_links_keep_href_and_stripped_text_parts(self):
+        self.assertEqual(self.page.links, [
+            ('/staff', ['Staff', 'list']),
+            ('mailto:amina.saidi@univ-batna2.dz?subject=x', ['Mail']),
+        ])
+    
+    def test_data_email(self):
+        self.assertEqual(self.page.data_emails, [('yacine.ferhat@usthb.dz', ['Yacine'])])
+    
+    def test_meta_content(self):
+        self.assertEqual(self.page.meta_contents, ['Contact karim.haddad@univ-batna2.dz'])
+    
+    def test_script_text(self):
+        self.assertEqual(self.page.scripts, ['var e = "nadia.khelifi@usthb.dz";', None])
+    
+    def test_text_skips_script_and_style(self):
+        text = self.page.get_text(separator=' ', strip=True)
+        self.assertIn('Text omar.zerrouki@univ-batna2.dz here', text)
+        self.assertNotIn('nadia.khelifi', text)
+        self.assertNotIn('display', text)
+    
+    def test_unclosed_tags(self):
+        page = PageContent.parse('<a href="/x">one <a href="/y">two')
+        self.assertEqual(page.links, [('/x', ['one']), ('/y', ['two'])])
+    
+    def test_empty_document(self):
+        page = PageContent.parse('')
+        self.assertEqual(page.links, [])
+        self.assertIsNone(page.title)
+
+
+class ExtractEmailsTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        cls.scraper = EmailScraper()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.scraper.close()
+        logging.disable(logging.NOTSET)
+    
+    def test_every_source(self):
+        emails = self.scraper.extract_emails_from_html(PAGE, 'https://www.univ-batna2.dz/x')
+        self.assertEqual([(e['email'], e['parse_method']) for e in emails], [
+            ('amina.saidi@univ-batna2.dz', 'mailto_link'),
+            ('yacine.ferhat@usthb.dz', 'data_attribute'),
+            ('karim.haddad@univ-batna2.dz', 'meta_tag'),
+            ('omar.zerrouki@univ-batna2.dz', 'regex_html'),
+            ('nadia.khelifi@usthb.dz', 'script_tag'),
+        ])
+    
+    def test_back_to_back_addresses(self):
+        matches = [m.group(0) for m in self.scraper.email_pattern.finditer('x@a.dz.b@c.dz')]
+        self.assertEqual(matches, ['x@a.dz', '.b@c.dz'])
+    
+    def test_page_without_email_hint(self):
+        self.assertEqual(self.scraper.extract_emails_from_html('<p>no address here</p>', 'https://a.dz/'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
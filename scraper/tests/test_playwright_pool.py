@@ -0,0 +1,44 @@
+"""Tests for PlaywrightPool scheduling, with the browser left out."""
+import sys
+import threading
+import unittest
+from concurrent.futures import TimeoutError as FutureTimeout
+from pathlib import Path
+
+scraper_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scraper_dir / "scripts"))
+sys.path.insert(0, str(scraper_dir))
+from scraper import PlaywrightPool
+
+
+class PlaywrightPoolTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.pool = PlaywrightPool(1)
+        self.pool._call = lambda fn, *args: fn(None, *args)  # No browser needed
+        self.addCleanup(self.pool.close)
+    
+    def test_result(self):
+        self.assertEqual(self.pool.run(lambda browser, x: x * 2, 21, timeout=5), 42)
+    
+    def test_timeout_drops_queued_call(self):
+        started, release = threading.Event(), threading.Event()
+        calls = []
+        
+        def hold_browser(browser):
+            started.set()
+            release.wait(5)
+        
+        busy = threading.Thread(target=self.pool.run, args=(hold_browser,))
+        busy.start()
+        started.wait(5)
+        with self.assertRaises(FutureTimeout):
+            self.pool.run(lambda browser: calls.append(1), timeout=0.05)
+        release.set()
+        busy.join()
+        self.pool.run(lambda browser: None)
+        self.assertEqual(calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
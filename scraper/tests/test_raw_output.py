@@ -0,0 +1,112 @@
+"""Tests for the raw CSV output, plain and gzipped."""
+import csv
+import gzip
+import logging
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+scraper_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scraper_dir / "scripts"))
+sys.path.insert(0, str(scraper_dir))
+import scraper
+from scraper import EmailScraper, truncate_incomplete_gzip_member
+
+
+def record(email: str) -> dict:
+    return {'email': email, 'domain': email.split('@')[1], 'source_url': 'https://usthb.dz/staff',
+            'page_title': '=cmd', 'found_at': '2024-01-01T00:00:00'}
+
+
+class TruncateIncompleteGzipMemberTest(unittest.TestCase):
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / 'emails_raw.csv.gz'
+        self.complete = gzip.compress(b'a' * 100000) + gzip.compress(b'b\n')
+    
+    def test_complete_file_untouched(self):
+        self.path.write_bytes(self.complete)
+        self.assertFalse(truncate_incomplete_gzip_member(self.path))
+        self.assertEqual(self.path.read_bytes(), self.complete)
+    
+    def test_truncated_member_cut_off(self):
+        partial = gzip.compress(b'c' * 1000)[:-5]  # No trailer, as after a kill
+        self.path.write_bytes(self.complete + partial)
+        self.assertTrue(truncate_incomplete_gzip_member(self.path))
+        self.assertEqual(self.path.read_bytes(), self.complete)
+    
+    def test_only_member_truncated(self):
+        self.path.write_bytes(gzip.compress(b'c' * 1000)[:20])
+        self.assertTrue(truncate_incomplete_gzip_member(self.path))
+        self.assertEqual(self.path.read_bytes(), b'')
+
+
+class RawOutputTest(unittest.TestCase):
+    
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+    
+    def use_output(self, name: str) -> Path:
+        path = self.dir / name
+        for attr, value in (('OUTPUT_RAW', path), ('DATA_DIR', self.dir)):
+            patcher = mock.patch.object(scraper, attr, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        return path
+    
+    def write_run(self, *batches):
+        instance = EmailScraper()
+        try:
+            for batch in batches:
+                instance.save_raw_emails(batch)
+        finally:
+            instance.close()
+    
+    def read_rows(self, path: Path, opener=open):
+        with opener(path, 'rt', encoding='utf-8', newline='') as f:
+            return [(row['email'], row['page_title']) for row in csv.DictReader(f)]
+    
+    def test_plain_round_trip(self):
+        path = self.use_output('emails_raw.csv')
+        self.write_run([record('karim.haddad@usthb.dz')], [record('amina.saidi@usthb.dz')])
+        self.write_run([record('omar.zerrouki@usthb.dz')])
+        self.assertEqual(self.read_rows(path), [
+            ('karim.haddad@usthb.dz', "'=cmd"),
+            ('amina.saidi@usthb.dz', "'=cmd"),
+            ('omar.zerrouki@usthb.dz', "'=cmd"),
+        ])
+    
+    def test_close_twice(self):
+        path = self.use_output('emails_raw.csv')
+        instance = EmailScraper()
+        instance.save_raw_emails([record('karim.haddad@usthb.dz')])
+        instance.close()
+        instance.close()
+        self.assertEqual(self.read_rows(path), [('karim.haddad@usthb.dz', "'=cmd")])
+    
+    def test_gzip_round_trip_after_killed_run(self):
+        path = self.use_output('emails_raw.csv.gz')
+        self.write_run([record('karim.haddad@usthb.dz')], [record('amina.saidi@usthb.dz')])
+        # A run killed while writing its batch leaves a member without a trailer
+        with open(path, 'ab') as f:
+            f.write(gzip.compress(b'nadia.khelifi@usthb.dz,nadia.khelifi\r\n')[:-6])
+        
+        self.write_run([record('omar.zerrouki@usthb.dz')])
+        
+        self.assertEqual(self.read_rows(path, gzip.open), [
+            ('karim.haddad@usthb.dz', "'=cmd"),
+            ('amina.saidi@usthb.dz', "'=cmd"),
+            ('omar.zerrouki@usthb.dz', "'=cmd"),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Tests for the in-memory robots.txt cache (TTLs and LRU eviction)."""
+import io
+import logging
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+scraper_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scraper_dir / "scripts"))
+sys.path.insert(0, str(scraper_dir))
+import scraper
+from scraper import EmailScraper
+
+
+class RobotsCacheTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        cls.scraper = EmailScraper()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.scraper.close()
+        logging.disable(logging.NOTSET)
+    
+    def setUp(self):
+        self.fetched = []
+        self.now = 1000.0
+        self.scraper.robots_cache.clear()
+        for target, name, value in ((self.scraper, 'disk_cache', None),
+                                    (self.scraper.robots_session, 'get', self.fake_get),
+                                    (scraper.time, 'monotonic', lambda: self.now),
+                                    (scraper, 'ROBOTS_CACHE_TTL_SECONDS', 300),
+                                    (scraper, 'ROBOTS_NEGATIVE_TTL_SECONDS', 60),
+                                    (scraper, 'ROBOTS_CACHE_SIZE', 2)):
+            patcher = mock.patch.object(target, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    def fake_get(self, url, **kwargs):
+        self.fetched.append(url)
+        response = requests.Response()
+        response.url = url
+        if url.startswith('https://down.dz/'):
+            response.status_code = 503
+            response.raw = io.BytesIO(b'')
+        else:
+            response.status_code = 200
+            response.encoding = 'utf-8'
+            response.raw = io.BytesIO(b'User-agent: *\nDisallow: /admin\n')
+        return response
+    
+    def test_parser_cached_per_base_domain(self):
+        rp = self.scraper.get_robots_parser('https://www.usthb.dz/a')
+        self.assertFalse(rp.can_fetch('*', 'https://usthb.dz/admin'))
+        self.assertIs(self.scraper.get_robots_parser('https://staff.usthb.dz/b'), rp)
+        self.assertEqual(self.fetched, ['https://usthb.dz/robots.txt'])
+    
+    def test_refetched_after_ttl(self):
+        self.scraper.get_robots_parser('https://usthb.dz/')
+        self.now += 301
+        self.scraper.get_robots_parser('https://usthb.dz/')
+        self.assertEqual(self.fetched, ['https://usthb.dz/robots.txt'] * 2)
+    
+    def test_failure_retried_after_negative_ttl(self):
+        self.assertIsNone(self.scraper.get_robots_parser('https://down.dz/'))
+        self.now += 59
+        self.assertIsNone(self.scraper.get_robots_parser('https://down.dz/'))
+        self.assertEqual(len(self.fetched), 1)
+        self.now += 2
+        self.scraper.get_robots_parser('https://down.dz/')
+        self.assertEqual(len(self.fetched), 2)
+    
+    def test_least_recently_used_evicted(self):
+        for host in ('a.dz', 'b.dz', 'a.dz', 'c.dz', 'a.dz', 'b.dz'):
+            self.scraper.get_robots_parser(f'https://{host}/')
+        self.assertEqual(self.fetched, ['https://a.dz/robots.txt', 'https://b.dz/robots.txt',
+                                        'https://c.dz/robots.txt', 'https://b.dz/robots.txt'])
+
+
+if __name__ == '__main__':
+    unittest.main()
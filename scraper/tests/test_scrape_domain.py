@@ -0,0 +1,59 @@
+"""Tests for the scrape_domain crawl loop, with _process_url replaced by canned pages."""
+import logging
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+scraper_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(scraper_dir / "scripts"))
+sys.path.insert(0, str(scraper_dir))
+import scraper
+from scraper import EmailScraper
+
+SEED = 'https://staff.usthb.dz/'  # Already a subdomain - no subdomain probing
+
+
+class ScrapeDomainTest(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+        cls.scraper = EmailScraper()
+    
+    @classmethod
+    def tearDownClass(cls):
+        cls.scraper.close()
+        logging.disable(logging.NOTSET)
+    
+    def setUp(self):
+        self.scraper.max_workers = 2
+        self.fast_page_done = threading.Event()
+    
+    def process_url(self, url, normalized_seed):
+        if url == SEED:
+            links = [SEED + 'fast', SEED + 'slow']
+        elif url.endswith('/fast'):
+            # Enough links to overflow the queue limit and stop the crawl
+            links = [f'{SEED}list/{i}' for i in range(50)]
+            self.fast_page_done.set()
+        elif url.endswith('/slow'):
+            # Still being fetched when the crawl stops
+            self.fast_page_done.wait()
+            time.sleep(0.2)
+            links = []
+        else:
+            self.fail(f"Unexpected fetch {url}")
+        return url, [{'email': url}], '<html></html>', None, links
+    
+    def test_in_flight_pages_kept_when_stopping_early(self):
+        with mock.patch.object(scraper, 'MAX_PAGES_PER_DOMAIN', 4), \
+                mock.patch.object(self.scraper, '_process_url', self.process_url):
+            emails = [e['email'] for e in self.scraper.scrape_domain(SEED)]
+        self.assertEqual(sorted(emails), [SEED, SEED + 'fast', SEED + 'slow'])
+
+
+if __name__ == '__main__':
+    unittest.main()